@@ -5,10 +5,10 @@ from pathlib import Path
 from dft.core.config import ProjectConfig
 
 
-def update_gitignore_for_state(project_config: ProjectConfig) -> None:
-    """Update .gitignore based on state configuration"""
+def update_gitignore_for_state(project_config: ProjectConfig, base_path: Path = Path(".")) -> None:
+    """Update the .gitignore in base_path based on state configuration"""
     
-    gitignore_path = Path(".gitignore")
+    gitignore_path = base_path / ".gitignore"
     state_entry = ".dft/state/"
     
     if not gitignore_path.exists():
@@ -14,13 +14,18 @@ def init_project(project_name: str, pipelines_dir: str) -> None:
         return
     
     try:
-        # Create project structure
-        project_path.mkdir()
-        (project_path / pipelines_dir).mkdir()
-        (project_path / "tests").mkdir()
-        (project_path / "output").mkdir()  # Create output directory
-        (project_path / ".dft").mkdir()
-        (project_path / ".dft" / "logs").mkdir()  # Create logs directory
+        # Create project structure (parents such as .dft and dft are created implicitly)
+        for subdir in (
+            pipelines_dir,
+            "tests",
+            "output",
+            ".dft/logs",
+            "data",
+            "dft/sources",
+            "dft/processors",
+            "dft/endpoints",
+        ):
+            (project_path / subdir).mkdir(parents=True, exist_ok=True)
         
         # Create dft_project.yml
         project_config = f"""# DFT Project Configuration
@@ -110,7 +115,7 @@ steps:
     endpoint_type: my_custom  # This will use MyCustomEndpoint class
     depends_on: [process_data]
     config:
-      output_path: "output/custom_processed_data.txt"
+      output_path: "output/custom_processed_data.csv"
 """
         
         (project_path / pipelines_dir / "custom_example_pipeline.yml").write_text(custom_pipeline)
@@ -133,9 +138,6 @@ API_KEY=your_api_key_here
         
         (project_path / ".env.example").write_text(env_template)
         
-        # Create sample data directory and sample CSV file
-        (project_path / "data").mkdir()
-        
         # Create sample CSV data
         sample_csv_data = """id,name,value,category,date
 1,Alice,100,A,2024-01-01
@@ -151,12 +153,6 @@ API_KEY=your_api_key_here
         
         (project_path / "data" / "sample.csv").write_text(sample_csv_data)
         
-        # Create custom components directories
-        (project_path / "dft").mkdir()
-        (project_path / "dft" / "sources").mkdir()
-        (project_path / "dft" / "processors").mkdir()
-        (project_path / "dft" / "endpoints").mkdir()
-        
         # Create __init__.py files for custom components
         (project_path / "dft" / "__init__.py").write_text('"""Custom DFT components"""')
         (project_path / "dft" / "sources" / "__init__.py").write_text('"""Custom data sources"""')
@@ -166,7 +162,11 @@ API_KEY=your_api_key_here
         # Create example custom components
         example_source = '''"""Example custom data source"""
 
+from datetime import datetime
 from typing import Any, Dict, Optional
+
+import pyarrow as pa
+
 from dft.core.base import DataSource
 from dft.core.data_packet import DataPacket
 
@@ -176,35 +176,18 @@ class MyCustomSource(DataSource):
     
     def extract(self, variables: Optional[Dict[str, Any]] = None) -> DataPacket:
         """Extract sample data"""
-        # Example: generate sample data with pandas fallback
-        try:
-            import pandas as pd
-            data = {
-                'id': [1, 2, 3, 4, 5],
-                'name': ['Alice', 'Bob', 'Charlie', 'David', 'Eve'],
-                'value': [10, 20, 30, 40, 50]
-            }
-            df = pd.DataFrame(data)
-            timestamp = pd.Timestamp.now()
-        except ImportError:
-            # Fallback if pandas not available
-            data = [
-                {'id': 1, 'name': 'Alice', 'value': 10},
-                {'id': 2, 'name': 'Bob', 'value': 20},
-                {'id': 3, 'name': 'Charlie', 'value': 30},
-                {'id': 4, 'name': 'David', 'value': 40},
-                {'id': 5, 'name': 'Eve', 'value': 50}
-            ]
-            df = data  # Use list of dicts as fallback
-            from datetime import datetime
-            timestamp = datetime.now()
+        table = pa.table({
+            'id': [1, 2, 3, 4, 5],
+            'name': ['Alice', 'Bob', 'Charlie', 'David', 'Eve'],
+            'value': [10, 20, 30, 40, 50]
+        })
         
         return DataPacket(
-            data=df,
+            data=table,
             metadata={
                 'source': 'MyCustomSource',
-                'row_count': len(df) if hasattr(df, '__len__') else 5,
-                'generated_at': timestamp
+                'row_count': table.num_rows,
+                'generated_at': datetime.now()
             }
         )
     
@@ -215,8 +198,12 @@ class MyCustomSource(DataSource):
         
         example_processor = '''"""Example custom data processor"""
 
-from typing import Any, Dict, Optional
 from datetime import datetime
+from typing import Any, Dict, Optional
+
+import pyarrow as pa
+import pyarrow.compute as pc
+
 from dft.core.base import DataProcessor
 from dft.core.data_packet import DataPacket
 
@@ -226,44 +213,31 @@ class MyCustomProcessor(DataProcessor):
     
     def process(self, packet: DataPacket, variables: Optional[Dict[str, Any]] = None) -> DataPacket:
         """Process data by doubling the 'value' column"""
-        try:
-            import pandas as pd
-            df = packet.data.copy()
-            
-            # Example processing: double the value column if it exists
-            if 'value' in df.columns:
-                df['value'] = df['value'] * 2
-                df['processed'] = True
-            
-            timestamp = pd.Timestamp.now()
-        except ImportError:
-            # Fallback for non-pandas data
-            if isinstance(packet.data, list):
-                df = []
-                for row in packet.data:
-                    new_row = row.copy()
-                    if 'value' in new_row:
-                        new_row['value'] = new_row['value'] * 2
-                        new_row['processed'] = True
-                    df.append(new_row)
-            else:
-                df = packet.data
-            timestamp = datetime.now()
+        table = packet.data
+        
+        # Example processing: double the value column if it exists
+        idx = table.schema.get_field_index('value')
+        if idx != -1:
+            table = table.set_column(idx, 'value', pc.multiply(table.column('value'), 2))
+            table = table.append_column('processed', pa.repeat(True, table.num_rows))
         
         return DataPacket(
-            data=df,
+            data=table,
             metadata={
                 **packet.metadata,
                 'processor': 'MyCustomProcessor',
-                'processed_at': timestamp
+                'processed_at': datetime.now()
             }
         )
 '''
         
         example_endpoint = '''"""Example custom data endpoint"""
 
+from pathlib import Path
 from typing import Any, Dict, Optional
-from datetime import datetime
+
+import pyarrow.csv as pa_csv
+
 from dft.core.base import DataEndpoint
 from dft.core.data_packet import DataPacket
 
@@ -272,47 +246,19 @@ class MyCustomEndpoint(DataEndpoint):
     """Example custom endpoint that prints data info"""
     
     def load(self, packet: DataPacket, variables: Optional[Dict[str, Any]] = None) -> bool:
-        """Load data by printing information about it"""
-        data = packet.data
+        """Load data by printing information about it and saving it as CSV"""
+        table = packet.data
         
-        try:
-            import pandas as pd
-            print(f"Custom endpoint received data:")
-            print(f"  Shape: {data.shape}")
-            print(f"  Columns: {list(data.columns)}")
-            print(f"  Sample data:")
-            print(data.head().to_string(index=False))
-            
-            # Save to file
-            output_path = self.get_config('output_path', 'output/custom_data.txt')
-            with open(output_path, 'w') as f:
-                f.write(f"Data processed at {pd.Timestamp.now()}\\n")
-                f.write(f"Shape: {data.shape}\\n")
-                f.write(f"Columns: {list(data.columns)}\\n")
-                f.write("\\nData:\\n")
-                f.write(data.to_string(index=False))
-            
-        except ImportError:
-            # Fallback for non-pandas data
-            print(f"Custom endpoint received data:")
-            if isinstance(data, list):
-                print(f"  Rows: {len(data)}")
-                if data:
-                    print(f"  Columns: {list(data[0].keys()) if isinstance(data[0], dict) else 'N/A'}")
-                    print(f"  Sample data: {data[:3]}")
-            else:
-                print(f"  Data type: {type(data)}")
-                print(f"  Data: {data}")
-            
-            # Save to file
-            output_path = self.get_config('output_path', 'output/custom_data.txt')
-            with open(output_path, 'w') as f:
-                f.write(f"Data processed at {datetime.now()}\\n")
-                if isinstance(data, list):
-                    f.write(f"Rows: {len(data)}\\n")
-                    f.write(f"Sample data: {data[:5]}\\n")
-                else:
-                    f.write(f"Data: {data}\\n")
+        print(f"Custom endpoint received data:")
+        print(f"  Shape: ({table.num_rows}, {table.num_columns})")
+        print(f"  Columns: {table.column_names}")
+        print(f"  Sample data:")
+        print(table.slice(0, 5).to_pylist())
+        
+        # You could save to file, send to API, etc.
+        output_path = self.get_config('output_path', 'output/custom_data.csv')
+        Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+        pa_csv.write_csv(table, output_path)
         
         return True
 '''
@@ -342,19 +288,14 @@ venv/
         (project_path / ".gitignore").write_text(gitignore)
         
         # Update gitignore based on state configuration
-        import os
-        old_cwd = os.getcwd()
         try:
-            os.chdir(project_path)
             from .gitignore import update_gitignore_for_state
             from dft.core.config import ProjectConfig
             
-            project_config = ProjectConfig("dft_project.yml")
-            update_gitignore_for_state(project_config)
+            project_config = ProjectConfig(str(project_path / "dft_project.yml"))
+            update_gitignore_for_state(project_config, project_path)
         except Exception as e:
             click.echo(f"Warning: Could not update gitignore for state config: {e}")
-        finally:
-            os.chdir(old_cwd)
         
         click.echo(f"✅ DFT project '{project_name}' initialized successfully!")
         click.echo(f"📁 Created directory structure:")
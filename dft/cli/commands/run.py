@@ -49,12 +49,10 @@ def run_pipelines(
         from ...core.runner import PipelineRunner
         
         # Parse variables from command line
-        variables = {}
-        if vars:
-            for var_pair in vars.split(","):
-                if "=" in var_pair:
-                    key, value = var_pair.split("=", 1)
-                    variables[key.strip()] = value.strip()
+        variables = {
+            key.strip(): value.strip()
+            for key, value in (pair.split("=", 1) for pair in (vars or "").split(",") if "=" in pair)
+        }
         
         # Create and run pipeline runner
         runner = PipelineRunner()
@@ -75,10 +75,13 @@ class PipelineLoader:
     def __init__(self, project_config: ProjectConfig):
         self.project_config = project_config
         self.pipelines_dir = Path(project_config.pipelines_dir)
+        # Files that failed to parse on the last load_all_pipelines() call, with their errors
+        self.load_errors: Dict[Path, str] = {}
     
     def load_all_pipelines(self) -> List[Pipeline]:
         """Load all pipeline configurations from directory"""
         pipelines = []
+        self.load_errors = {}
         
         if not self.pipelines_dir.exists():
             return pipelines
@@ -89,6 +92,7 @@ class PipelineLoader:
                 if pipeline:
                     pipelines.append(pipeline)
             except Exception as e:
+                self.load_errors[yaml_file] = str(e)
                 print(f"Error loading pipeline {yaml_file}: {e}")
         
         # Validate pipeline dependencies
@@ -2,18 +2,28 @@
 
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterable, Optional
+import sys
+import time
 
+# slots drop the per-instance __dict__ (dataclass support needs Python 3.10+)
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_SLOTS)
 class SimpleDataPacket:
     """Simplified data packet for testing without external dependencies"""
     
     data: Any = None
     metadata: Dict[str, Any] = field(default_factory=dict)
-    timestamp: datetime = field(default_factory=datetime.now)
+    timestamp: int = field(default_factory=time.time_ns)  # nanoseconds since the epoch
     source: str = "unknown"
     
+    @property
+    def timestamp_dt(self) -> datetime:
+        """Get the timestamp as a local datetime"""
+        return datetime.fromtimestamp(self.timestamp / 1e9)
+    
     @property
     def row_count(self) -> int:
         """Get number of rows in the data"""
@@ -23,6 +33,11 @@ class SimpleDataPacket:
             return len(self.data)
         return 1
     
+    @staticmethod
+    def total_rows(packets: Iterable["SimpleDataPacket"]) -> int:
+        """Get the combined number of rows across packets"""
+        return sum(packet.row_count for packet in packets)
+    
     @property
     def column_names(self) -> list[str]:
         """Get column names"""
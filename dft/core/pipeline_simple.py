@@ -1,11 +1,74 @@
 """Simplified pipeline for testing without external dependencies"""
 
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
 from datetime import datetime
+import heapq
+import sys
 
+# slots drop the per-instance __dict__ (dataclass support needs Python 3.10+)
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+def _intern(value: Any) -> Any:
+    """Intern string step IDs, leaving other ID types untouched"""
+    return sys.intern(value) if type(value) is str else value
+
+
+# Pipelines up to this size are sorted with one int bitmask per step instead of Kahn's queues
+_BITMASK_MAX_STEPS = 32
+
+
+def _toposort_bitmask(count: int, edges: List[Tuple[int, int]]) -> List[int]:
+    """Topologically sort step positions of a small pipeline using int bitsets"""
+    pred_masks = [0] * count
+    for dep, step in edges:
+        pred_masks[step] |= 1 << dep
+    
+    remaining = (1 << count) - 1
+    order = []
+    while remaining:
+        # Take the lowest remaining position whose predecessors have all been placed
+        candidates = remaining
+        while candidates:
+            bit = candidates & -candidates
+            i = bit.bit_length() - 1
+            if not pred_masks[i] & remaining:
+                break
+            candidates ^= bit
+        else:
+            break  # every remaining step waits on another one: cycle
+        order.append(i)
+        remaining ^= bit
+    return order
+
+
+def _toposort_kahn(count: int, edges: List[Tuple[int, int]]) -> List[int]:
+    """Topologically sort step positions with Kahn's algorithm, lowest ready position first"""
+    in_degree = [0] * count
+    successors: List[List[int]] = [[] for _ in range(count)]
+    for dep, step in edges:
+        successors[dep].append(step)
+        in_degree[step] += 1
+    
+    ready = [i for i in range(count) if in_degree[i] == 0]
+    order = []
+    while ready:
+        i = heapq.heappop(ready)
+        order.append(i)
+        for next_i in successors[i]:
+            in_degree[next_i] -= 1
+            if in_degree[next_i] == 0:
+                heapq.heappush(ready, next_i)
+    return order
+
+
+def _same_objects(a: Optional[Tuple[Any, ...]], b: Tuple[Any, ...]) -> bool:
+    """Check two snapshots hold the very same objects in the same order"""
+    return a is not None and len(a) == len(b) and all(x is y for x, y in zip(a, b))
+
+
+@dataclass(**_SLOTS)
 class SimplePipelineStep:
     """Single step in a pipeline"""
     id: str
@@ -18,6 +81,11 @@ class SimplePipelineStep:
     start_time: Optional[datetime] = None
     end_time: Optional[datetime] = None
     error_message: Optional[str] = None
+    
+    def __post_init__(self) -> None:
+        # Interned IDs let index and dependency lookups match by identity first
+        self.id = _intern(self.id)
+        self.depends_on = [_intern(dep_id) for dep_id in self.depends_on or ()]
 
 
 @dataclass 
@@ -34,53 +102,94 @@ class SimplePipeline:
     start_time: Optional[datetime] = None
     end_time: Optional[datetime] = None
     
+    # Derived from steps/tags and tagged with a snapshot of what they were built from
+    _graph_source: Optional[Tuple[Any, ...]] = field(default=None, init=False, repr=False, compare=False)
+    _step_index: Dict[str, SimplePipelineStep] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _deps: Dict[str, Tuple[SimplePipelineStep, ...]] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _order_cache: Optional[Tuple[List[str], List[str]]] = field(default=None, init=False, repr=False, compare=False)
+    _tag_source: Optional[Tuple[str, ...]] = field(default=None, init=False, repr=False, compare=False)
+    _tag_set: FrozenSet[str] = field(default=frozenset(), init=False, repr=False, compare=False)
+    
+    def add_step(self, step: SimplePipelineStep) -> None:
+        """Append a step to the pipeline"""
+        self.steps.append(step)
+    
+    def remove_step(self, step_id: str) -> None:
+        """Remove a step by ID"""
+        self.steps[:] = [step for step in self.steps if step.id != step_id]
+    
     def get_step(self, step_id: str) -> Optional[SimplePipelineStep]:
         """Get step by ID"""
-        for step in self.steps:
-            if step.id == step_id:
-                return step
-        return None
+        self._refresh_graph()
+        return self._step_index.get(step_id)
     
     def get_dependencies(self, step_id: str) -> List[SimplePipelineStep]:
         """Get dependency steps for given step"""
-        step = self.get_step(step_id)
-        if not step:
-            return []
-        
-        deps = []
-        for dep_id in step.depends_on:
-            dep_step = self.get_step(dep_id)
-            if dep_step:
-                deps.append(dep_step)
-        return deps
+        self._refresh_graph()
+        return list(self._deps.get(step_id, ()))
     
     def get_execution_order(self) -> List[str]:
         """Get topologically sorted execution order"""
-        visited = set()
-        temp_visited = set()
-        result = []
+        order, blocked = self._sorted()
+        if blocked:
+            raise ValueError(f"Circular dependency detected involving steps: {', '.join(blocked)}")
+        return list(order)
+    
+    def detect_cycle(self) -> Optional[List[str]]:
+        """Get steps on or downstream of a dependency cycle, or None if there is no cycle"""
+        _, blocked = self._sorted()
+        return list(blocked) or None
+    
+    def _sorted(self) -> Tuple[List[str], List[str]]:
+        """Get the cached result of _toposort"""
+        self._refresh_graph()
+        if self._order_cache is None:
+            self._order_cache = self._toposort()
+        return self._order_cache
+    
+    def _refresh_graph(self) -> None:
+        """Rebuild the step index and dependency adjacency if any step, step id or dependency changed"""
+        # steps, tags and depends_on are plain lists that callers may edit in place, so the
+        # caches are checked against every step, id and dependency id rather than the list object
+        source = tuple(item for step in self.steps for item in (step, step.id, *step.depends_on))
+        if _same_objects(self._graph_source, source):
+            return
         
-        def dfs(step_id: str) -> None:
-            if step_id in temp_visited:
-                raise ValueError(f"Circular dependency detected involving step: {step_id}")
-            if step_id in visited:
-                return
-                
-            temp_visited.add(step_id)
-            step = self.get_step(step_id)
-            if step:
-                for dep_id in step.depends_on:
-                    dfs(dep_id)
-            temp_visited.remove(step_id)
-            visited.add(step_id)
-            result.append(step_id)
+        # Reversed so the first step wins if ids repeat, like the original linear scan
+        index = {step.id: step for step in reversed(self.steps)}
+        self._step_index = index
+        self._deps = {
+            step_id: tuple(index[dep_id] for dep_id in step.depends_on if dep_id in index)
+            for step_id, step in index.items()
+        }
+        self._order_cache = None
+        self._graph_source = source
+    
+    def _toposort(self) -> Tuple[List[str], List[str]]:
+        """Sort step IDs after their dependencies, returning (order, cycle-blocked IDs)"""
+        step_ids = list(dict.fromkeys(step.id for step in self.steps))
+        position = {step_id: i for i, step_id in enumerate(step_ids)}
+        # Dependencies outside this pipeline do not constrain the order
+        edges = [
+            (position[dep_id], position[step.id])
+            for step in self.steps
+            for dep_id in frozenset(step.depends_on)
+            if dep_id in position
+        ]
         
-        for step in self.steps:
-            if step.id not in visited:
-                dfs(step.id)
+        sort = _toposort_bitmask if len(step_ids) <= _BITMASK_MAX_STEPS else _toposort_kahn
+        order = sort(len(step_ids), edges)
         
-        return result
+        # Steps left unordered are on a cycle or downstream of one
+        ordered = set(order)
+        blocked = [step_id for i, step_id in enumerate(step_ids) if i not in ordered]
+        return [step_ids[i] for i in order], blocked
     
     def has_tag(self, tag: str) -> bool:
         """Check if pipeline has specific tag"""
-        return tag in self.tags
\ No newline at end of file
+        # tags may be edited in place, so compare its contents rather than the list object
+        tags = tuple(self.tags)
+        if tags != self._tag_source:
+            self._tag_set = frozenset(_intern(t) for t in tags)
+            self._tag_source = tags
+        return tag in self._tag_set
@@ -1,20 +1,77 @@
 """ClickHouse data endpoint"""
 
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Set, Tuple
 import logging
+import threading
 import pyarrow as pa
 
 from ..core.base import DataEndpoint
 from ..core.data_packet import DataPacket
 
+DEFAULT_INSERT_CHUNK_SIZE = 65536
+
+
+def _quote_identifier(name: str) -> str:
+    """Backtick-quote a single ClickHouse identifier (dots stay part of the name, e.g. Nested columns)"""
+    return f"`{name.replace('`', '``')}`"
+
+
+def _quote_table(name: str) -> str:
+    """Backtick-quote a possibly database-qualified ClickHouse table name"""
+    return ".".join(map(_quote_identifier, name.split(".")))
+
 
 class ClickHouseEndpoint(DataEndpoint):
     """ClickHouse database data endpoint"""
 
+    # Idle clients shared by all endpoints, keyed by connection parameters
+    _idle_clients: Dict[frozenset, List[Any]] = {}
+    _pool_lock = threading.Lock()
+
+    # The runner builds a new endpoint per step, so lookups are cached process-wide:
+    # existing tables per (connection, database, table), INSERT text per table layout
+    _table_exists_cache: Set[Tuple[frozenset, str, str]] = set()
+    _insert_sql_cache: Dict[tuple, str] = {}
+
     def __init__(self, config: Dict[str, Any]):
         super().__init__(config)
         self.logger = logging.getLogger(f"dft.endpoints.clickhouse.{self.name}")
 
+        self._client_params = {
+            "host": self.get_config("host", "localhost"),
+            "port": self.get_config("port", 9000),
+            # Allow table_database to override connection database
+            "database": self.get_config("table_database") or self.get_config("database", "default"),
+            "user": self.get_config("user", "default"),
+            "password": self.get_config("password", ""),
+        }
+        self._pool_key = frozenset(self._client_params.items())
+
+    def _acquire_client(self):
+        """Reuse an idle pooled client for this endpoint's parameters, or create a new one"""
+        with self._pool_lock:
+            idle = self._idle_clients.get(self._pool_key)
+            client = idle.pop() if idle else None
+        if client is not None:
+            return client
+
+        try:
+            from clickhouse_driver import Client
+        except ImportError:
+            raise ImportError("clickhouse-driver is required for ClickHouse endpoint")
+        # The client connects lazily and reconnects on its own if the server dropped it
+        return Client(**self._client_params)
+
+    def _release_client(self, client, close: bool = False) -> None:
+        """Keep a client for reuse, disconnecting it instead if it may be broken or the pool is full"""
+        if not close:
+            with self._pool_lock:
+                idle = self._idle_clients.setdefault(self._pool_key, [])
+                if len(idle) < self.get_config("max_connections", 10):
+                    idle.append(client)
+                    return
+        client.disconnect()
+
     def load(self, packet: DataPacket, variables: Optional[Dict[str, Any]] = None) -> bool:
         """Load data to ClickHouse table"""
 
@@ -22,60 +79,31 @@ class ClickHouseEndpoint(DataEndpoint):
         if not table_name:
             raise ValueError("table is required for ClickHouse endpoint")
 
-        try:
-            from clickhouse_driver import Client
-        except ImportError:
-            raise ImportError("clickhouse-driver is required for ClickHouse endpoint")
-
-        # Connection parameters
-        host = self.get_config("host", "localhost")
-        port = self.get_config("port", 9000)
-        # Allow table_database to override connection database
-        database = self.get_config("table_database") or self.get_config("database", "default")
-        user = self.get_config("user", "default")
-        password = self.get_config("password", "")
+        database = self._client_params["database"]
 
         # Load mode
         mode = self.get_config("mode", "append")  # append, replace, upsert
         auto_create = self.get_config("auto_create", True)
 
+        client = self._acquire_client()
         try:
-            client = Client(
-                host=host,
-                port=port,
-                database=database,
-                user=user,
-                password=password,
-            )
-
             # Check if table exists
             table_exists = self._table_exists(client, table_name)
 
             if not table_exists and auto_create:
                 self._create_table(client, table_name, packet.data)
+                self._table_exists_cache.add((self._pool_key, database, table_name))
                 self.logger.info(f"Created table {table_name}")
 
             # Handle different load modes
             if mode == "replace":
                 # Truncate table first
-                client.execute(f"TRUNCATE TABLE {table_name}")
+                client.execute(f"TRUNCATE TABLE {_quote_table(table_name)}")
                 self.logger.info(f"Truncated table {table_name}")
 
-            # Convert Arrow to format suitable for ClickHouse
-            data_list = packet.to_dict_list()
-
-            if data_list:
-                # Get column names and prepare data
-                columns = list(data_list[0].keys())
-                # Handle None values - replace with empty string for string columns
-                # and appropriate defaults for other types
-                def handle_none_value(value):
-                    if value is None:
-                        return ""  # ClickHouse String columns need empty string instead of None
-                    return value
-                
-                values = [tuple(handle_none_value(row[col]) for col in columns) for row in data_list]
+            columns = packet.column_names
 
+            if packet.row_count:
                 if mode == "upsert":
                     # Get upsert key columns (required for upsert mode)
                     upsert_keys = self.get_config("upsert_keys")
@@ -91,11 +119,7 @@ class ClickHouseEndpoint(DataEndpoint):
                     # This is more reliable than ReplacingMergeTree which works asynchronously
                     
                     # Group values by unique key combination to optimize DELETE operations
-                    unique_key_values = set()
-                    for row_tuple in values:
-                        row_dict = dict(zip(columns, row_tuple))
-                        key_tuple = tuple(row_dict[key] for key in upsert_keys)
-                        unique_key_values.add(key_tuple)
+                    unique_key_values = set(zip(*(self._column_values(packet.data.column(key)) for key in upsert_keys)))
                     
                     if unique_key_values:
                         # Build WHERE condition for ALTER TABLE DELETE (compatible with older ClickHouse versions)
@@ -110,7 +134,7 @@ class ClickHouseEndpoint(DataEndpoint):
                             else:
                                 formatted_values = ", ".join(key_values)
                             
-                            delete_query = f"ALTER TABLE {table_name} DELETE WHERE {key_name} IN ({formatted_values})"
+                            delete_query = f"ALTER TABLE {_quote_table(table_name)} DELETE WHERE {_quote_identifier(key_name)} IN ({formatted_values})"
                         else:
                             # Multiple keys - use OR conditions for each combination
                             conditions = []
@@ -119,12 +143,12 @@ class ClickHouseEndpoint(DataEndpoint):
                                 for i, key_name in enumerate(upsert_keys):
                                     value = key_tuple[i]
                                     if isinstance(value, str):
-                                        key_conditions.append(f"{key_name} = '{value}'")
+                                        key_conditions.append(f"{_quote_identifier(key_name)} = '{value}'")
                                     else:
-                                        key_conditions.append(f"{key_name} = {value}")
+                                        key_conditions.append(f"{_quote_identifier(key_name)} = {value}")
                                 conditions.append(f"({' AND '.join(key_conditions)})")
                             
-                            delete_query = f"ALTER TABLE {table_name} DELETE WHERE {' OR '.join(conditions)}"
+                            delete_query = f"ALTER TABLE {_quote_table(table_name)} DELETE WHERE {' OR '.join(conditions)}"
                         
                         # Execute DELETE
                         client.execute(delete_query)
@@ -133,30 +157,62 @@ class ClickHouseEndpoint(DataEndpoint):
                     self.logger.debug(f"Using upsert mode with keys: {upsert_keys}")
 
                 # Insert new data (works for both regular insert and upsert after DELETE)
-                insert_query = f"INSERT INTO {table_name} ({', '.join(columns)}) VALUES"
-                client.execute(insert_query, values)
+                insert_query = self._insert_sql(table_name, columns)
+                # Arrow data is already column-major, so stream it as columnar blocks
+                chunk_size = self.get_config("insert_chunk_size", DEFAULT_INSERT_CHUNK_SIZE)
+                for batch in packet.data.to_batches(max_chunksize=chunk_size):
+                    client.execute(
+                        insert_query, [self._column_values(column) for column in batch.columns], columnar=True
+                    )
 
                 action = "upserted" if mode == "upsert" else "loaded"
-                self.logger.debug(f"{action.capitalize()} {len(values)} rows to ClickHouse table {table_name}")
+                self.logger.debug(f"{action.capitalize()} {packet.row_count} rows to ClickHouse table {table_name}")
             else:
                 self.logger.warning("No data to load to ClickHouse")
 
+            self._release_client(client)
             return True
 
         except Exception as e:
+            self._release_client(client, close=True)
             self.logger.error(f"Failed to load to ClickHouse: {e}")
             raise RuntimeError(f"ClickHouse load failed: {e}")
 
+    def _insert_sql(self, table_name: str, columns: list) -> str:
+        """Build the INSERT statement once per table and column layout"""
+        key = (table_name, tuple(columns))
+        insert_sql = self._insert_sql_cache.get(key)
+        if insert_sql is None:
+            column_list = ", ".join(map(_quote_identifier, columns))
+            insert_sql = f"INSERT INTO {_quote_table(table_name)} ({column_list}) VALUES"
+            self._insert_sql_cache[key] = insert_sql
+        return insert_sql
+
+    @staticmethod
+    def _column_values(column) -> list:
+        """Convert an Arrow column to a list, replacing None with empty string"""
+        values = column.to_pylist()
+        if not column.null_count:
+            return values
+        # ClickHouse String columns need empty string instead of None
+        return ["" if value is None else value for value in values]
+
     def _table_exists(self, client, table_name: str) -> bool:
         """Check if table exists"""
+        database = self._client_params["database"]
+        key = (self._pool_key, database, table_name)
+        if key in self._table_exists_cache:
+            return True
         try:
-            database = self.get_config("table_database") or self.get_config("database", "default")
             result = client.execute(
                 "SELECT count() FROM system.tables WHERE database = %s AND name = %s", [database, table_name]
             )
-            return result[0][0] > 0
         except Exception:
             return False
+        if result[0][0] > 0:
+            self._table_exists_cache.add(key)
+            return True
+        return False
 
     def _create_table(self, client, table_name: str, _: pa.Table) -> None:
         """Create table from explicit schema definition"""
@@ -167,39 +223,32 @@ class ClickHouseEndpoint(DataEndpoint):
             raise ValueError(f"Schema is required for ClickHouse endpoint. Please define schema for table {table_name}")
 
         # Build column definitions from user-defined schema only
-        columns = []
-        for column_name, column_type in user_schema.items():
-            columns.append(f"{column_name} {column_type}")
+        columns_sql = ", ".join(f"{_quote_identifier(name)} {column_type}" for name, column_type in user_schema.items())
 
         # Create table SQL
         engine = self.get_config("engine", "MergeTree()")
         order_by = self.get_config("order_by", "tuple()")
 
         create_sql = f"""
-        CREATE TABLE IF NOT EXISTS {table_name} (
-            {', '.join(columns)}
+        CREATE TABLE IF NOT EXISTS {_quote_table(table_name)} (
+            {columns_sql}
         ) ENGINE = {engine}
         ORDER BY {order_by}
         """
 
         client.execute(create_sql)
-        self.logger.debug(f"Created ClickHouse table {table_name} with schema: {columns}")
+        self.logger.debug(f"Created ClickHouse table {table_name} with schema: {columns_sql}")
 
     def test_connection(self) -> bool:
         """Test ClickHouse connection"""
         try:
-            from clickhouse_driver import Client
-
-            database = self.get_config("table_database") or self.get_config("database", "default")
-            client = Client(
-                host=self.get_config("host", "localhost"),
-                port=self.get_config("port", 9000),
-                database=database,
-                user=self.get_config("user", "default"),
-                password=self.get_config("password", ""),
-            )
-
-            client.execute("SELECT 1")
+            client = self._acquire_client()
+            try:
+                client.execute("SELECT 1")
+            except Exception:
+                self._release_client(client, close=True)
+                raise
+            self._release_client(client)
             return True
 
         except Exception as e:
@@ -1,12 +1,39 @@
 """MySQL data endpoint"""
 
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Set, Tuple
+import functools
 import logging
+import os
+import tempfile
+import threading
 import pyarrow as pa
+import pyarrow.csv as pa_csv
 
 from ..core.base import DataEndpoint
 from ..core.data_packet import DataPacket
 
+# Rows converted to Python tuples at a time on the INSERT path
+DEFAULT_INSERT_CHUNK_SIZE = 10000
+
+
+@functools.cache
+def _pymysql():
+    """Import PyMySQL once per process"""
+    try:
+        import pymysql
+    except ImportError:
+        raise ImportError("PyMySQL is required for MySQL endpoint")
+    return pymysql
+
+
+def _naive_utc_timestamps(arrow_table: pa.Table) -> pa.Table:
+    """Convert tz-aware timestamp columns to naive UTC, since DATETIME columns have no time zone"""
+    for i, field in enumerate(arrow_table.schema):
+        if pa.types.is_timestamp(field.type) and field.type.tz:
+            naive_type = pa.timestamp(field.type.unit)
+            arrow_table = arrow_table.set_column(i, pa.field(field.name, naive_type), arrow_table.column(i).cast(naive_type))
+    return arrow_table
+
 
 class MySQLEndpoint(DataEndpoint):
     """
@@ -26,6 +53,11 @@ class MySQLEndpoint(DataEndpoint):
         auto_create (bool): Auto-create table if not exists (default: True)
         schema (dict): Table schema for auto-creation (required if auto_create=True)
         upsert_keys (list): Unique columns for upsert mode (required if mode='upsert')
+        max_connections (int): Maximum idle pooled connections kept per server (default: 10)
+        insert_chunk_size (int): Rows sent per executemany call (default: 10000)
+        use_load_data (bool): Bulk load with LOAD DATA LOCAL INFILE; the server must allow local_infile (default: False).
+            LOCAL implies IGNORE, so MySQL only warns about bad values and duplicate keys; any warning
+            or short row count rolls the load back and retries it with INSERT
     
     YAML Example - Basic:
         steps:
@@ -81,23 +113,20 @@ class MySQLEndpoint(DataEndpoint):
               mode: "append"
     """
     
+    # Idle connections shared by all endpoints, keyed by connection parameters
+    _idle_connections: Dict[frozenset, List[Any]] = {}
+    _pool_lock = threading.Lock()
+
+    # The runner builds a new endpoint per step, so lookups are cached process-wide:
+    # existing tables per (connection, database, table), SQL text per table layout
+    _table_exists_cache: Set[Tuple[frozenset, Optional[str], str]] = set()
+    _insert_sql_cache: Dict[tuple, str] = {}
+    
     def __init__(self, config: Dict[str, Any]):
         super().__init__(config)
         self.logger = logging.getLogger(f"dft.endpoints.mysql.{self.name}")
-    
-    def load(self, packet: DataPacket, variables: Optional[Dict[str, Any]] = None) -> bool:
-        """Load data to MySQL table"""
-        
-        table_name = self.get_config("table")
-        if not table_name:
-            raise ValueError("table is required for MySQL endpoint")
-        
-        try:
-            import pymysql
-        except ImportError:
-            raise ImportError("PyMySQL is required for MySQL endpoint")
-        
-        # Connection parameters
+
+        # Connection parameters, resolved once and shared by load, delete and connection tests
         conn_params = {
             "host": self.get_config("host", "localhost"),
             "port": self.get_config("port", 3306),
@@ -106,15 +135,28 @@ class MySQLEndpoint(DataEndpoint):
             "password": self.get_config("password"),
             "charset": self.get_config("charset", "utf8mb4"),
         }
+        self._conn_params = {k: v for k, v in conn_params.items() if v is not None}
+        if self.get_config("use_load_data", False):
+            self._conn_params["local_infile"] = True
+        self._pool_key = frozenset(self._conn_params.items())
+    
+    def load(self, packet: DataPacket, variables: Optional[Dict[str, Any]] = None) -> bool:
+        """Load data to MySQL table"""
         
-        conn_params = {k: v for k, v in conn_params.items() if v is not None}
+        table_name = self.get_config("table")
+        if not table_name:
+            raise ValueError("table is required for MySQL endpoint")
+        
+        _pymysql()
         
         # Load mode
         mode = self.get_config("mode", "append")  # append, replace, upsert
         auto_create = self.get_config("auto_create", True)
+        use_load_data = self.get_config("use_load_data", False)
         
+        conn = None
         try:
-            conn = pymysql.connect(**conn_params)
+            conn = self._acquire_connection()
             cur = conn.cursor()
             
             # Check if table exists
@@ -123,6 +165,7 @@ class MySQLEndpoint(DataEndpoint):
             if not table_exists and auto_create:
                 self._create_table(cur, table_name, packet.data)
                 conn.commit()
+                self._table_exists_cache.add((self._pool_key, self.get_config("database"), table_name))
                 self.logger.info(f"Created table {table_name}")
             
             # Handle different load modes
@@ -131,67 +174,158 @@ class MySQLEndpoint(DataEndpoint):
                 conn.commit()
                 self.logger.info(f"Truncated table {table_name}")
             
-            # Convert Arrow to list of dicts for bulk insert
-            data_list = packet.to_dict_list()
-            
-            if data_list:
-                # Get column names
-                columns = list(data_list[0].keys())
-                column_placeholders = ', '.join(['%s'] * len(columns))
+            columns = packet.column_names
+
+            if packet.row_count:
                 column_names = ', '.join([f'`{col}`' for col in columns])
-                
-                if mode == "upsert":
-                    # Get upsert key columns (required for upsert mode)
-                    upsert_keys = self.get_config("upsert_keys")
-                    if not upsert_keys:
-                        raise ValueError("upsert_keys is required for upsert mode. Specify unique columns for conflict resolution.")
-                    
-                    # Validate that all upsert keys exist in data
-                    if not all(key in columns for key in upsert_keys):
-                        missing_keys = [key for key in upsert_keys if key not in columns]
-                        raise ValueError(f"Upsert keys {missing_keys} not found in data columns: {columns}")
-                    
-                    # Build ON DUPLICATE KEY UPDATE clause
-                    update_columns = [col for col in columns if col not in upsert_keys]
-                    if update_columns:
-                        update_clause = ', '.join([f'`{col}` = VALUES(`{col}`)' for col in update_columns])
-                        insert_sql = f'INSERT INTO `{table_name}` ({column_names}) VALUES ({column_placeholders}) ON DUPLICATE KEY UPDATE {update_clause}'
-                    else:
-                        # If no columns to update, just ignore duplicates
-                        insert_sql = f'INSERT IGNORE INTO `{table_name}` ({column_names}) VALUES ({column_placeholders})'
-                    
-                    self.logger.debug(f"Using upsert mode with keys: {upsert_keys}")
-                else:
-                    # Prepare regular bulk insert SQL
-                    insert_sql = f'INSERT INTO `{table_name}` ({column_names}) VALUES ({column_placeholders})'
-                
-                # Convert data to tuples for bulk insert
-                data_tuples = [tuple(row[col] for col in columns) for row in data_list]
-                
-                # Execute bulk insert using executemany
-                cur.executemany(insert_sql, data_tuples)
+
+                # LOAD DATA cannot express ON DUPLICATE KEY UPDATE, so upserts always go through INSERT
+                use_load_data = use_load_data and mode != "upsert"
+                if not (use_load_data and self._load_data(conn, cur, table_name, column_names, packet.data)):
+                    self._insert_rows(cur, table_name, columns, column_names, mode, packet)
                 conn.commit()
-                
+
                 action = "upserted" if mode == "upsert" else "loaded"
-                self.logger.debug(f"{action.capitalize()} {len(data_list)} rows to MySQL table {table_name}")
+                self.logger.debug(f"{action.capitalize()} {packet.row_count} rows to MySQL table {table_name}")
             else:
                 self.logger.warning("No data to load to MySQL")
             
             cur.close()
-            conn.close()
+            self._release_connection(conn)
             return True
             
         except Exception as e:
+            if conn is not None:
+                self._release_connection(conn, close=True)
             self.logger.error(f"Failed to load to MySQL: {e}")
             raise RuntimeError(f"MySQL load failed: {e}")
     
+    def _acquire_connection(self):
+        """Reuse an idle pooled connection for this endpoint's parameters, or open a new one"""
+        pymysql = _pymysql()
+
+        with self._pool_lock:
+            idle = self._idle_connections.get(self._pool_key)
+            conn = idle.pop() if idle else None
+
+        if conn is not None:
+            try:
+                conn.ping(reconnect=True)
+                return conn
+            except Exception:
+                pass  # Server went away and reconnect failed; open a fresh connection
+        return pymysql.connect(**self._conn_params)
+
+    def _release_connection(self, conn, close: bool = False) -> None:
+        """Keep a connection for reuse, closing it instead if it may be broken or the pool is full"""
+        if not close:
+            with self._pool_lock:
+                idle = self._idle_connections.setdefault(self._pool_key, [])
+                if len(idle) < self.get_config("max_connections", 10):
+                    idle.append(conn)
+                    return
+        conn.close()
+
+    def _load_data(self, conn, cursor, table_name: str, column_names: str, arrow_table: pa.Table) -> bool:
+        """Bulk load an Arrow table with LOAD DATA LOCAL INFILE, returning False if it fails or warns"""
+        arrow_table = _naive_utc_timestamps(arrow_table)
+        for i, field in enumerate(arrow_table.schema):
+            if pa.types.is_boolean(field.type):
+                # MySQL has no boolean type; write booleans as 0/1 for TINYINT(1) columns
+                arrow_table = arrow_table.set_column(i, field.name, arrow_table.column(i).cast(pa.int8()))
+
+        # An unquoted NULL is read as SQL NULL, while quoted strings (including "NULL") stay literal
+        write_options = pa_csv.WriteOptions(include_header=False, null_string="NULL")
+        with tempfile.NamedTemporaryFile(suffix=".csv", delete=False) as tmp:
+            tmp_path = tmp.name
+        try:
+            pa_csv.write_csv(arrow_table, tmp_path, write_options=write_options)
+            cursor.execute(
+                f"LOAD DATA LOCAL INFILE %s INTO TABLE `{table_name}` "
+                "FIELDS TERMINATED BY ',' OPTIONALLY ENCLOSED BY '\"' ESCAPED BY '' "
+                f"LINES TERMINATED BY '\\n' ({column_names})",
+                (tmp_path,),
+            )
+            loaded_rows = cursor.rowcount
+
+            # With LOCAL, rejected or coerced rows are warnings rather than errors
+            cursor.execute("SHOW COUNT(*) WARNINGS")
+            warning_count = cursor.fetchone()[0]
+            if warning_count or loaded_rows != arrow_table.num_rows:
+                raise RuntimeError(
+                    f"loaded {loaded_rows} of {arrow_table.num_rows} rows with {warning_count} warnings"
+                )
+            return True
+        except Exception as e:
+            conn.rollback()
+            self.logger.warning(f"LOAD DATA failed, falling back to INSERT: {e}")
+            return False
+        finally:
+            os.unlink(tmp_path)
+
+    def _insert_rows(self, cursor, table_name: str, columns: list, column_names: str, mode: str, packet: DataPacket) -> None:
+        """Insert rows with executemany (used for upserts and when LOAD DATA is not enabled)"""
+        insert_sql = self._insert_sql(table_name, columns, column_names, mode)
+
+        # Insert chunk by chunk so only one chunk of Python row tuples is alive at a time
+        chunk_size = self.get_config("insert_chunk_size", DEFAULT_INSERT_CHUNK_SIZE)
+        for batch in _naive_utc_timestamps(packet.data).to_batches(max_chunksize=chunk_size):
+            # Arrow is column-major, so zip whole columns into row tuples instead of building a dict per row
+            data_tuples = list(zip(*(column.to_pylist() for column in batch.columns)))
+
+            # Execute bulk insert using executemany
+            cursor.executemany(insert_sql, data_tuples)
+
+    def _insert_sql(self, table_name: str, columns: list, column_names: str, mode: str) -> str:
+        """Build the INSERT statement once per table, column layout, mode and upsert keys"""
+        upsert_keys = self.get_config("upsert_keys") if mode == "upsert" else None
+        cache_key = (table_name, tuple(columns), mode, tuple(upsert_keys or ()))
+        insert_sql = self._insert_sql_cache.get(cache_key)
+        if insert_sql is not None:
+            return insert_sql
+
+        column_placeholders = ', '.join(['%s'] * len(columns))
+
+        if mode == "upsert":
+            # Upsert key columns are required for upsert mode
+            if not upsert_keys:
+                raise ValueError("upsert_keys is required for upsert mode. Specify unique columns for conflict resolution.")
+
+            # Validate that all upsert keys exist in data
+            if not all(key in columns for key in upsert_keys):
+                missing_keys = [key for key in upsert_keys if key not in columns]
+                raise ValueError(f"Upsert keys {missing_keys} not found in data columns: {columns}")
+
+            # Build ON DUPLICATE KEY UPDATE clause
+            update_columns = [col for col in columns if col not in upsert_keys]
+            if update_columns:
+                update_clause = ', '.join([f'`{col}` = VALUES(`{col}`)' for col in update_columns])
+                insert_sql = f'INSERT INTO `{table_name}` ({column_names}) VALUES ({column_placeholders}) ON DUPLICATE KEY UPDATE {update_clause}'
+            else:
+                # If no columns to update, just ignore duplicates
+                insert_sql = f'INSERT IGNORE INTO `{table_name}` ({column_names}) VALUES ({column_placeholders})'
+
+            self.logger.debug(f"Using upsert mode with keys: {upsert_keys}")
+        else:
+            # Prepare regular bulk insert SQL
+            insert_sql = f'INSERT INTO `{table_name}` ({column_names}) VALUES ({column_placeholders})'
+
+        self._insert_sql_cache[cache_key] = insert_sql
+        return insert_sql
+
     def _table_exists(self, cursor, table_name: str) -> bool:
         """Check if table exists"""
+        key = (self._pool_key, self.get_config("database"), table_name)
+        if key in self._table_exists_cache:
+            return True
         try:
             cursor.execute("SHOW TABLES LIKE %s", (table_name,))
-            return cursor.fetchone() is not None
+            exists = cursor.fetchone() is not None
         except Exception:
             return False
+        if exists:
+            self._table_exists_cache.add(key)
+        return exists
     
     def _create_table(self, cursor, table_name: str, arrow_table: pa.Table) -> None:
         """Create table from explicit schema definition"""
@@ -202,38 +336,23 @@ class MySQLEndpoint(DataEndpoint):
             raise ValueError(f"Schema is required for MySQL endpoint. Please define schema for table {table_name}")
         
         # Build column definitions from user-defined schema only
-        columns = []
-        for column_name, column_type in user_schema.items():
-            columns.append(f"`{column_name}` {column_type}")
+        columns_sql = ", ".join(f"`{column_name}` {column_type}" for column_name, column_type in user_schema.items())
         
         # Create table SQL
         create_sql = f"""
         CREATE TABLE IF NOT EXISTS `{table_name}` (
-            {', '.join(columns)}
+            {columns_sql}
         ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4
         """
         
         cursor.execute(create_sql)
-        self.logger.debug(f"Created MySQL table {table_name} with schema: {columns}")
+        self.logger.debug(f"Created MySQL table {table_name} with schema: {columns_sql}")
     
     def test_connection(self) -> bool:
         """Test MySQL connection"""
         try:
-            import pymysql
-            
-            conn_params = {
-                "host": self.get_config("host", "localhost"),
-                "port": self.get_config("port", 3306),
-                "database": self.get_config("database"),
-                "user": self.get_config("user"),
-                "password": self.get_config("password"),
-                "charset": self.get_config("charset", "utf8mb4"),
-            }
-            
-            conn_params = {k: v for k, v in conn_params.items() if v is not None}
-            
-            conn = pymysql.connect(**conn_params)
-            conn.close()
+            conn = self._acquire_connection()
+            self._release_connection(conn)
             return True
             
         except Exception as e:
@@ -1,35 +1,172 @@
 """PostgreSQL data endpoint"""
 
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+import functools
+import io
 import logging
+import threading
 from datetime import datetime
+import numpy as np
 import pyarrow as pa
+import pyarrow.csv as pa_csv
 
 from ..core.base import DataEndpoint
 from ..core.data_packet import DataPacket
 
+# Rows sent per multi-row INSERT statement (psycopg2 defaults to 100)
+DEFAULT_PAGE_SIZE = 1000
+
+# Rows converted to Python tuples at a time on the INSERT path
+DEFAULT_INSERT_CHUNK_SIZE = 10000
+
+# Rows encoded at a time while streaming COPY data
+DEFAULT_COPY_CHUNK_SIZE = 65536
+
+# Binary COPY framing: signature, flags and header extension length, then a -1 field count trailer
+_PGCOPY_HEADER = b"PGCOPY\n\xff\r\n\x00" + bytes(8)
+_PGCOPY_TRAILER = b"\xff\xff"
+
+# PostgreSQL binary timestamps and dates count from 2000-01-01 rather than the Unix epoch
+_PG_EPOCH_MICROS = 946_684_800_000_000
+_PG_EPOCH_DAYS = 10_957
+
+
+# Explicit casts for execute_values templates keyed by Arrow type id; unlisted types are sent as plain %s.
+# Floats stay uncast: a real/double precision cast would round values bound for numeric columns
+_PG_CASTS = {
+    pa.lib.Type_BOOL: "boolean",
+    pa.lib.Type_INT8: "smallint",
+    pa.lib.Type_INT16: "smallint",
+    pa.lib.Type_INT32: "integer",
+    pa.lib.Type_INT64: "bigint",
+    pa.lib.Type_UINT8: "smallint",
+    pa.lib.Type_UINT16: "integer",
+    pa.lib.Type_UINT32: "bigint",
+    pa.lib.Type_UINT64: "numeric",
+    pa.lib.Type_DATE32: "date",
+}
+
+
+@functools.cache
+def _psycopg2():
+    """Import psycopg2 with the extras submodule, once per process"""
+    try:
+        import psycopg2
+        import psycopg2.extras
+    except ImportError:
+        raise ImportError("psycopg2 is required for PostgreSQL endpoint")
+    return psycopg2
+
+
+def _pg_cast(arrow_type: pa.DataType) -> Optional[str]:
+    """PostgreSQL type to cast an Arrow column's values to, if it maps unambiguously"""
+    if pa.types.is_timestamp(arrow_type):
+        return "timestamptz" if arrow_type.tz else "timestamp"
+    return _PG_CASTS.get(arrow_type.id)
+
+
+def _binary_copy_column(column: pa.ChunkedArray) -> Optional[np.ndarray]:
+    """Encode a null-free fixed-width Arrow column as big-endian PostgreSQL binary values"""
+    arrow_type = column.type
+    if pa.types.is_boolean(arrow_type):
+        return column.to_numpy().astype(">u1")
+    if pa.types.is_int16(arrow_type) or pa.types.is_int32(arrow_type) or pa.types.is_int64(arrow_type):
+        return column.to_numpy().astype(f">i{arrow_type.bit_width // 8}")
+    if pa.types.is_float32(arrow_type) or pa.types.is_float64(arrow_type):
+        return column.to_numpy().astype(f">f{arrow_type.bit_width // 8}")
+    if pa.types.is_timestamp(arrow_type):
+        micros = column.to_numpy().astype("datetime64[us]").view(np.int64)
+        return (micros - _PG_EPOCH_MICROS).astype(">i8")
+    if pa.types.is_date32(arrow_type):
+        days = column.to_numpy().astype("datetime64[D]").view(np.int64)
+        return (days - _PG_EPOCH_DAYS).astype(">i4")
+    return None
+
+
+def _binary_copy_rows(arrow_table: pa.Table) -> Optional[bytes]:
+    """Encode a table's rows as binary COPY tuples, or return None if any column is nullable or not fixed-width"""
+    encoded = []
+    for column in arrow_table.columns:
+        values = _binary_copy_column(column) if not column.null_count else None
+        if values is None:
+            return None
+        encoded.append(values)
+
+    # Every row has the same layout (field count, then a length/value pair per column),
+    # so the whole chunk is one packed structured array
+    dtype = [("field_count", ">i2")]
+    for i, values in enumerate(encoded):
+        dtype += [(f"length_{i}", ">i4"), (f"value_{i}", values.dtype)]
+    rows = np.empty(arrow_table.num_rows, dtype=dtype)
+    rows["field_count"] = len(encoded)
+    for i, values in enumerate(encoded):
+        rows[f"length_{i}"] = values.dtype.itemsize
+        rows[f"value_{i}"] = values
+    return rows.tobytes()
+
+
+def _binary_copy_chunks(arrow_table: pa.Table, chunk_size: int) -> Optional[Iterator[bytes]]:
+    """Binary COPY payload encoded chunk_size rows at a time, or None if the table cannot be sent in binary"""
+    # Checking an empty slice rejects unsupported column types without encoding anything
+    if any(column.null_count for column in arrow_table.columns) or _binary_copy_rows(arrow_table.slice(0, 0)) is None:
+        return None
+
+    def chunks():
+        yield _PGCOPY_HEADER
+        for offset in range(0, arrow_table.num_rows, chunk_size):
+            yield _binary_copy_rows(arrow_table.slice(offset, chunk_size))
+        yield _PGCOPY_TRAILER
+    return chunks()
+
+
+def _csv_copy_chunks(arrow_table: pa.Table, chunk_size: int) -> Iterator[bytes]:
+    """CSV COPY payload encoded chunk_size rows at a time"""
+    # Nulls are written as unquoted empty fields, which CSV COPY reads as NULL
+    write_options = pa_csv.WriteOptions(include_header=False)
+    for offset in range(0, arrow_table.num_rows, chunk_size):
+        buffer = io.BytesIO()
+        pa_csv.write_csv(arrow_table.slice(offset, chunk_size), buffer, write_options=write_options)
+        yield buffer.getvalue()
+
+
+class _ChunkReader:
+    """Minimal file object over an iterator of byte chunks, so COPY pulls one encoded chunk at a time"""
+
+    def __init__(self, chunks: Iterator[bytes]):
+        self._chunks = chunks
+        self._chunk = memoryview(b"")
+        self._pos = 0
+
+    def read(self, size: int = -1) -> bytes:
+        while self._pos >= len(self._chunk):
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                return b""
+            self._chunk, self._pos = memoryview(chunk), 0
+        end = len(self._chunk) if size is None or size < 0 else self._pos + size
+        data = self._chunk[self._pos:end].tobytes()
+        self._pos += len(data)
+        return data
+
 
 class PostgreSQLEndpoint(DataEndpoint):
     """PostgreSQL database data endpoint"""
     
+    # Idle connections shared by all endpoints, keyed by connection parameters
+    _idle_connections: Dict[frozenset, List[Any]] = {}
+    _pool_lock = threading.Lock()
+
+    # The runner builds a new endpoint per step, so lookups are cached process-wide:
+    # existing tables per (connection, schema, table), SQL text per table layout
+    _table_exists_cache: Set[Tuple[frozenset, str, str]] = set()
+    _insert_sql_cache: Dict[tuple, str] = {}
+    _values_template_cache: Dict[pa.Schema, str] = {}
+    
     def __init__(self, config: Dict[str, Any]):
         super().__init__(config)
         self.logger = logging.getLogger(f"dft.endpoints.postgresql.{self.name}")
-    
-    def load(self, packet: DataPacket, variables: Optional[Dict[str, Any]] = None) -> bool:
-        """Load data to PostgreSQL table"""
-        
-        table_name = self.get_config("table")
-        if not table_name:
-            raise ValueError("table is required for PostgreSQL endpoint")
-        
-        try:
-            import psycopg2
-            import psycopg2.extras
-        except ImportError:
-            raise ImportError("psycopg2 is required for PostgreSQL endpoint")
-        
-        # Connection parameters
+
+        # Connection parameters, resolved once and shared by load, delete and connection tests
         conn_params = {
             "host": self.get_config("host", "localhost"),
             "port": self.get_config("port", 5432),
@@ -37,15 +174,27 @@ class PostgreSQLEndpoint(DataEndpoint):
             "user": self.get_config("user"),
             "password": self.get_config("password"),
         }
+        self._conn_params = {k: v for k, v in conn_params.items() if v is not None}
+        self._pool_key = frozenset(self._conn_params.items())
+    
+    def load(self, packet: DataPacket, variables: Optional[Dict[str, Any]] = None) -> bool:
+        """Load data to PostgreSQL table"""
         
-        conn_params = {k: v for k, v in conn_params.items() if v is not None}
+        table_name = self.get_config("table")
+        if not table_name:
+            raise ValueError("table is required for PostgreSQL endpoint")
+        
+        _psycopg2()
         
         # Load mode
         mode = self.get_config("mode", "append")  # append, replace, upsert
         auto_create = self.get_config("auto_create", True)
         
+        conn = None
         try:
-            conn = psycopg2.connect(**conn_params)
+            conn = self._acquire_connection()
+            # Create, truncate and load in one transaction so they share a single commit
+            conn.autocommit = False
             cur = conn.cursor()
             
             # Check if table exists
@@ -53,75 +202,182 @@ class PostgreSQLEndpoint(DataEndpoint):
             
             if not table_exists and auto_create:
                 self._create_table(cur, table_name, packet.data)
-                conn.commit()
+                table_exists = True
                 self.logger.info(f"Created table {table_name}")
             
             # Handle different load modes
             if mode == "replace":
                 qualified_table_name = self._get_qualified_table_name(table_name)
                 cur.execute(f"TRUNCATE TABLE {qualified_table_name}")
-                conn.commit()
                 self.logger.info(f"Truncated table {table_name}")
             
-            # Convert Arrow to list of dicts for bulk insert
-            data_list = packet.to_dict_list()
-            
-            if data_list:
-                # Get column names
-                columns = list(data_list[0].keys())
-                column_placeholders = ', '.join(['%s'] * len(columns))
+            columns = packet.column_names
+
+            if packet.row_count:
                 column_names = ', '.join([f'"{col}"' for col in columns])
-                
-                if mode == "upsert":
-                    # Get upsert key columns (required for upsert mode)
-                    upsert_keys = self.get_config("upsert_keys")
-                    if not upsert_keys:
-                        raise ValueError("upsert_keys is required for upsert mode. Specify unique columns for conflict resolution.")
-                    
-                    # Validate that all upsert keys exist in data
-                    if not all(key in columns for key in upsert_keys):
-                        missing_keys = [key for key in upsert_keys if key not in columns]
-                        raise ValueError(f"Upsert keys {missing_keys} not found in data columns: {columns}")
-                    
-                    # Build ON CONFLICT DO UPDATE clause
-                    update_columns = [col for col in columns if col not in upsert_keys]
-                    conflict_columns = ', '.join([f'"{key}"' for key in upsert_keys])
-                    
-                    if update_columns:
-                        update_clause = ', '.join([f'"{col}" = EXCLUDED."{col}"' for col in update_columns])
-                        qualified_table_name = self._get_qualified_table_name(table_name)
-                        insert_sql = f'INSERT INTO {qualified_table_name} ({column_names}) VALUES ({column_placeholders}) ON CONFLICT ({conflict_columns}) DO UPDATE SET {update_clause}'
-                    else:
-                        # If no columns to update, just ignore conflicts
-                        qualified_table_name = self._get_qualified_table_name(table_name)
-                        insert_sql = f'INSERT INTO {qualified_table_name} ({column_names}) VALUES ({column_placeholders}) ON CONFLICT ({conflict_columns}) DO NOTHING'
-                    
-                    self.logger.debug(f"Using upsert mode with keys: {upsert_keys}")
-                else:
-                    # Prepare regular bulk insert SQL
-                    qualified_table_name = self._get_qualified_table_name(table_name)
-                    insert_sql = f'INSERT INTO {qualified_table_name} ({column_names}) VALUES ({column_placeholders})'
-                
-                # Convert data to tuples for bulk insert
-                data_tuples = [tuple(row[col] for col in columns) for row in data_list]
-                
-                # Execute bulk insert
-                psycopg2.extras.execute_batch(cur, insert_sql, data_tuples)
-                conn.commit()
-                
+                qualified_table_name = self._get_qualified_table_name(table_name)
+
+                # COPY cannot resolve conflicts, so upserts always go through INSERT. So do tz-aware
+                # timestamps: COPY would skip the session TimeZone conversion INSERT applies to them
+                # when the target column is a plain timestamp
+                use_copy = (
+                    mode != "upsert"
+                    and self.get_config("use_copy", True)
+                    and not any(pa.types.is_timestamp(field.type) and field.type.tz for field in packet.data.schema)
+                )
+                if not (use_copy and self._copy_table(cur, qualified_table_name, column_names, packet.data)):
+                    self._insert_rows(cur, qualified_table_name, columns, column_names, mode, packet)
+
                 action = "upserted" if mode == "upsert" else "loaded"
-                self.logger.debug(f"{action.capitalize()} {len(data_list)} rows to PostgreSQL table {table_name}")
+                self.logger.debug(f"{action.capitalize()} {packet.row_count} rows to PostgreSQL table {table_name}")
             else:
                 self.logger.warning("No data to load to PostgreSQL")
             
+            conn.commit()
+            if table_exists:
+                # Only cache after commit so a rolled-back CREATE TABLE is checked again
+                self._table_exists_cache.add((self._pool_key, self.get_config("pg_schema", "public"), table_name))
             cur.close()
-            conn.close()
+            self._release_connection(conn)
             return True
             
         except Exception as e:
+            if conn is not None:
+                # Closing the connection rolls back the whole create/truncate/load transaction
+                self._release_connection(conn, close=True)
             self.logger.error(f"Failed to load to PostgreSQL: {e}")
             raise RuntimeError(f"PostgreSQL load failed: {e}")
     
+    def _acquire_connection(self):
+        """Reuse a live idle pooled connection for this endpoint's parameters, or open a new one"""
+        psycopg2 = _psycopg2()
+
+        with self._pool_lock:
+            idle = self._idle_connections.get(self._pool_key)
+            conn = idle.pop() if idle else None
+
+        if conn is not None:
+            try:
+                # The server, a proxy or a firewall may have dropped the connection while it sat idle
+                if not conn.closed:
+                    with conn.cursor() as cur:
+                        cur.execute("SELECT 1")
+                    conn.rollback()
+                    return conn
+            except Exception:
+                pass
+            conn.close()
+        return psycopg2.connect(**self._conn_params)
+
+    def _release_connection(self, conn, close: bool = False) -> None:
+        """Keep a connection for reuse, closing it instead if it may be broken or the pool is full"""
+        if not close and not conn.closed:
+            with self._pool_lock:
+                idle = self._idle_connections.setdefault(self._pool_key, [])
+                if len(idle) < self.get_config("max_connections", 10):
+                    idle.append(conn)
+                    return
+        conn.close()
+
+    def _copy_table(self, cursor, qualified_table_name: str, column_names: str, arrow_table: pa.Table) -> bool:
+        """Bulk load an Arrow table with COPY FROM STDIN, returning False if COPY fails"""
+        # Encode lazily so only one chunk of COPY data is held in memory at a time
+        chunk_size = self.get_config("copy_chunk_size", DEFAULT_COPY_CHUNK_SIZE)
+        # Binary COPY needs column types that match the table exactly, so it is opt-in
+        chunks = None
+        if self.get_config("copy_format", "csv") == "binary":
+            chunks = _binary_copy_chunks(arrow_table, chunk_size)
+        if chunks is not None:
+            copy_format = "BINARY"
+        else:
+            chunks, copy_format = _csv_copy_chunks(arrow_table, chunk_size), "CSV"
+
+        # A savepoint lets a failed COPY be undone without losing the create/truncate before it
+        cursor.execute("SAVEPOINT dft_copy")
+        try:
+            cursor.copy_expert(
+                f"COPY {qualified_table_name} ({column_names}) FROM STDIN WITH (FORMAT {copy_format})",
+                _ChunkReader(chunks),
+            )
+            cursor.execute("RELEASE SAVEPOINT dft_copy")
+            return True
+        except Exception as e:
+            cursor.execute("ROLLBACK TO SAVEPOINT dft_copy")
+            self.logger.warning(f"COPY failed, falling back to INSERT: {e}")
+            return False
+
+    def _insert_rows(self, cursor, qualified_table_name: str, columns: list, column_names: str, mode: str, packet: DataPacket) -> None:
+        """Insert rows with execute_values (used for upserts and when COPY is unavailable)"""
+        psycopg2 = _psycopg2()
+
+        insert_sql = self._insert_sql(qualified_table_name, columns, column_names, mode)
+        template = self._values_template(packet.data.schema)
+
+        upsert_keys = self.get_config("upsert_keys") or []
+        dedupe_keys = mode == "upsert" and any(col not in upsert_keys for col in columns)
+        if dedupe_keys:
+            key_positions = [columns.index(key) for key in upsert_keys]
+
+        # Insert chunk by chunk so only one chunk of Python row tuples is alive at a time
+        page_size = self.get_config("page_size", DEFAULT_PAGE_SIZE)
+        chunk_size = self.get_config("insert_chunk_size", DEFAULT_INSERT_CHUNK_SIZE)
+        for batch in packet.data.to_batches(max_chunksize=chunk_size):
+            # Arrow is column-major, so zip whole columns into row tuples instead of building a dict per row
+            data_tuples = list(zip(*(column.to_pylist() for column in batch.columns)))
+
+            if dedupe_keys:
+                # A multi-row ON CONFLICT DO UPDATE cannot touch the same key twice; keep the last row per key
+                data_tuples = list({tuple(row[i] for i in key_positions): row for row in data_tuples}.values())
+
+            psycopg2.extras.execute_values(cursor, insert_sql, data_tuples, template=template, page_size=page_size)
+
+    def _insert_sql(self, qualified_table_name: str, columns: list, column_names: str, mode: str) -> str:
+        """Build the INSERT statement once per table, column layout, mode and upsert keys"""
+        upsert_keys = self.get_config("upsert_keys") if mode == "upsert" else None
+        cache_key = (qualified_table_name, tuple(columns), mode, tuple(upsert_keys or ()))
+        insert_sql = self._insert_sql_cache.get(cache_key)
+        if insert_sql is not None:
+            return insert_sql
+
+        if mode == "upsert":
+            # Upsert key columns are required for upsert mode
+            if not upsert_keys:
+                raise ValueError("upsert_keys is required for upsert mode. Specify unique columns for conflict resolution.")
+
+            # Validate that all upsert keys exist in data
+            if not all(key in columns for key in upsert_keys):
+                missing_keys = [key for key in upsert_keys if key not in columns]
+                raise ValueError(f"Upsert keys {missing_keys} not found in data columns: {columns}")
+
+            # Build ON CONFLICT DO UPDATE clause
+            update_columns = [col for col in columns if col not in upsert_keys]
+            conflict_columns = ', '.join([f'"{key}"' for key in upsert_keys])
+
+            if update_columns:
+                update_clause = ', '.join([f'"{col}" = EXCLUDED."{col}"' for col in update_columns])
+                insert_sql = f'INSERT INTO {qualified_table_name} ({column_names}) VALUES %s ON CONFLICT ({conflict_columns}) DO UPDATE SET {update_clause}'
+            else:
+                # If no columns to update, just ignore conflicts
+                insert_sql = f'INSERT INTO {qualified_table_name} ({column_names}) VALUES %s ON CONFLICT ({conflict_columns}) DO NOTHING'
+
+            self.logger.debug(f"Using upsert mode with keys: {upsert_keys}")
+        else:
+            # Prepare regular bulk insert SQL
+            insert_sql = f'INSERT INTO {qualified_table_name} ({column_names}) VALUES %s'
+
+        self._insert_sql_cache[cache_key] = insert_sql
+        return insert_sql
+
+    def _values_template(self, schema: pa.Schema) -> str:
+        """Build the execute_values row template with explicit casts, once per Arrow schema"""
+        template = self._values_template_cache.get(schema)
+        if template is None:
+            # Strings and other loosely typed values stay uncast so they can fill json, enum, etc. columns
+            placeholders = [f"%s::{cast}" if (cast := _pg_cast(field.type)) else "%s" for field in schema]
+            template = f"({', '.join(placeholders)})"
+            self._values_template_cache[schema] = template
+        return template
+
     def _get_qualified_table_name(self, table_name: str) -> str:
         """Get fully qualified table name with schema"""
         pg_schema = self.get_config("pg_schema", "public")
@@ -129,8 +385,10 @@ class PostgreSQLEndpoint(DataEndpoint):
     
     def _table_exists(self, cursor, table_name: str) -> bool:
         """Check if table exists"""
+        pg_schema = self.get_config("pg_schema", "public")
+        if (self._pool_key, pg_schema, table_name) in self._table_exists_cache:
+            return True
         try:
-            pg_schema = self.get_config("pg_schema", "public")
             cursor.execute(
                 "SELECT EXISTS (SELECT FROM information_schema.tables WHERE table_schema = %s AND table_name = %s)",
                 (pg_schema, table_name)
@@ -148,22 +406,17 @@ class PostgreSQLEndpoint(DataEndpoint):
             raise ValueError(f"Schema is required for PostgreSQL endpoint. Please define schema for table {table_name}")
         
         # Build column definitions from user-defined schema only
-        columns = []
-        for column_name, column_type in user_schema.items():
-            columns.append(f'"{column_name}" {column_type}')
+        columns_sql = ", ".join(f'"{column_name}" {column_type}' for column_name, column_type in user_schema.items())
         
         # Create table SQL with schema support
-        pg_schema = self.get_config("pg_schema", "public")
-        qualified_table_name = f'"{pg_schema}"."{table_name}"'
-        
         create_sql = f'''
-        CREATE TABLE IF NOT EXISTS {qualified_table_name} (
-            {', '.join(columns)}
+        CREATE TABLE IF NOT EXISTS {self._get_qualified_table_name(table_name)} (
+            {columns_sql}
         )
         '''
         
         cursor.execute(create_sql)
-        self.logger.debug(f"Created PostgreSQL table {table_name} with schema: {columns}")
+        self.logger.debug(f"Created PostgreSQL table {table_name} with schema: {columns_sql}")
     
     def delete_batch_data(self, batch_start: datetime, batch_end: datetime) -> bool:
         """Delete data for microbatch window"""
@@ -176,20 +429,9 @@ class PostgreSQLEndpoint(DataEndpoint):
         if not table_name:
             raise ValueError("table is required for PostgreSQL endpoint")
         
+        conn = None
         try:
-            import psycopg2
-            
-            conn_params = {
-                "host": self.get_config("host", "localhost"),
-                "port": self.get_config("port", 5432),
-                "database": self.get_config("database"),
-                "user": self.get_config("user"),
-                "password": self.get_config("password"),
-            }
-            
-            conn_params = {k: v for k, v in conn_params.items() if v is not None}
-            
-            conn = psycopg2.connect(**conn_params)
+            conn = self._acquire_connection()
             cur = conn.cursor()
             
             # Delete data in batch window
@@ -205,32 +447,22 @@ class PostgreSQLEndpoint(DataEndpoint):
             conn.commit()
             
             cur.close()
-            conn.close()
+            self._release_connection(conn)
             
             self.logger.info(f"Deleted {deleted_rows} rows from {table_name} for batch window [{batch_start} - {batch_end})")
             return True
             
         except Exception as e:
+            if conn is not None:
+                self._release_connection(conn, close=True)
             self.logger.error(f"Failed to delete batch data: {e}")
             return False
     
     def test_connection(self) -> bool:
         """Test PostgreSQL connection"""
         try:
-            import psycopg2
-            
-            conn_params = {
-                "host": self.get_config("host", "localhost"),
-                "port": self.get_config("port", 5432),
-                "database": self.get_config("database"),
-                "user": self.get_config("user"),
-                "password": self.get_config("password"),
-            }
-            
-            conn_params = {k: v for k, v in conn_params.items() if v is not None}
-            
-            conn = psycopg2.connect(**conn_params)
-            conn.close()
+            conn = self._acquire_connection()
+            self._release_connection(conn)
             return True
             
         except Exception as e:
@@ -54,9 +54,22 @@ class DataValidator(DataProcessor):
                   not_null: true
     """
     
+    def __init__(self, config: Dict[str, Any]):
+        super().__init__(config)
+        # Null checks only apply to required columns, so schema_check alone validates nothing
+        self._has_checks = (
+            self.get_config("row_count_min") is not None
+            or self.get_config("row_count_max") is not None
+            or bool(self.get_config("required_columns"))
+        )
+    
     def process(self, packet: DataPacket, variables: Optional[Dict[str, Any]] = None) -> DataPacket:
         """Validate data packet"""
         
+        if not self._has_checks:
+            packet.add_metadata("validation_passed", True)
+            return packet
+        
         errors = []
         
         # Check row count constraints
@@ -71,21 +84,22 @@ class DataValidator(DataProcessor):
         
         # Check required columns
         required_columns = self.get_config("required_columns", [])
+        schema_names = frozenset(packet.data.schema.names) if packet.data is not None else frozenset()
         if required_columns:
-            missing_columns = set(required_columns) - set(packet.column_names)
+            missing_columns = [col for col in required_columns if col not in schema_names]
             if missing_columns:
-                errors.append(f"Missing required columns: {list(missing_columns)}")
+                errors.append(f"Missing required columns: {missing_columns}")
         
         # Check schema if enabled
         schema_check = self.get_config("schema_check", False)
         if schema_check and packet.data is not None:
             # Basic schema validation - check for null values in required columns
-            for col_name in required_columns:
-                if col_name in packet.column_names:
-                    column = packet.data.column(col_name)
-                    null_count = column.null_count
-                    if null_count > 0:
-                        errors.append(f"Column {col_name} contains {null_count} null values")
+            # (null_count is read from Arrow metadata, no data scan needed)
+            present_columns = [col for col in required_columns if col in schema_names]
+            for col_name, column in zip(present_columns, packet.data.select(present_columns).columns):
+                null_count = column.null_count
+                if null_count > 0:
+                    errors.append(f"Column {col_name} contains {null_count} null values")
         
         # If there are validation errors, raise exception
         if errors:
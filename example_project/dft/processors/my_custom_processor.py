@@ -1,6 +1,11 @@
 """Example custom data processor"""
 
+from datetime import datetime
 from typing import Any, Dict, Optional
+
+import pyarrow as pa
+import pyarrow.compute as pc
+
 from dft.core.base import DataProcessor
 from dft.core.data_packet import DataPacket
 
@@ -10,37 +15,19 @@ class MyCustomProcessor(DataProcessor):
     
     def process(self, packet: DataPacket, variables: Optional[Dict[str, Any]] = None) -> DataPacket:
         """Process data by doubling the 'value' column"""
-        data = packet.data
+        table = packet.data
         
-        try:
-            import pandas as pd
-            df = data.copy()
-            # Example processing: double the value column if it exists
-            if 'value' in df.columns:
-                df['value'] = df['value'] * 2
-                df['processed'] = True
-            processed_data = df
-            timestamp = pd.Timestamp.now()
-        except (ImportError, AttributeError):
-            # Fallback for list of dicts
-            if isinstance(data, list):
-                processed_data = []
-                for item in data:
-                    new_item = item.copy()
-                    if 'value' in new_item:
-                        new_item['value'] = new_item['value'] * 2
-                    new_item['processed'] = True
-                    processed_data.append(new_item)
-            else:
-                processed_data = data
-            from datetime import datetime
-            timestamp = datetime.now()
+        # Example processing: double the value column if it exists
+        idx = table.schema.get_field_index('value')
+        if idx != -1:
+            table = table.set_column(idx, 'value', pc.multiply(table.column('value'), 2))
+            table = table.append_column('processed', pa.repeat(True, table.num_rows))
         
         return DataPacket(
-            data=processed_data,
+            data=table,
             metadata={
                 **packet.metadata,
                 'processor': 'MyCustomProcessor',
-                'processed_at': timestamp
+                'processed_at': datetime.now()
             }
         )
\ No newline at end of file
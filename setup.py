@@ -12,6 +12,7 @@ setup(
     long_description=long_description,
     long_description_content_type="text/markdown",
     packages=find_packages(),
+    package_data={"dft.cli": ["templates/*.j2"]},
     classifiers=[
         "Development Status :: 4 - Beta",
         "Intended Audience :: Developers",
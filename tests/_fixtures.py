@@ -0,0 +1,56 @@
+"""Fixtures shared by the test modules"""
+
+from _yaml_util import fast_yaml_load
+
+# Pipeline YAML structure used by the configuration tests
+YAML_TEXT = """
+pipeline_name: test_pipeline
+tags: [test, example]
+depends_on: []
+
+steps:
+  - id: extract_data
+    type: source
+    source_type: csv
+    config:
+      file_path: "data.csv"
+  
+  - id: process_data
+    type: processor
+    processor_type: validator
+    depends_on: [extract_data]
+    config:
+      required_columns: [id, name]
+"""
+
+# Encoded up front so the loader reads UTF-8 bytes directly
+YAML_BYTES = YAML_TEXT.encode("utf-8")
+
+# Parsed once per test session; tests must treat it as read-only
+PARSED_CONFIG = fast_yaml_load(YAML_BYTES)
+
+
+def build_pipeline():
+    """Build the three-step extract -> validate -> save pipeline used by the structure tests"""
+    from dft.core.pipeline_simple import SimplePipeline, SimplePipelineStep
+    
+    steps = [
+        SimplePipelineStep(
+            id="extract",
+            type="source",
+            config={"source_type": "csv", "file_path": "test.csv"}
+        ),
+        SimplePipelineStep(
+            id="validate",
+            type="processor",
+            config={"processor_type": "validator"},
+            depends_on=["extract"]
+        ),
+        SimplePipelineStep(
+            id="save",
+            type="endpoint",
+            config={"endpoint_type": "csv", "file_path": "output.csv"},
+            depends_on=["validate"]
+        ),
+    ]
+    return SimplePipeline(name="test_pipeline", steps=steps, tags=["test"])
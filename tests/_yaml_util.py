@@ -0,0 +1,11 @@
+"""YAML helpers shared by the test modules"""
+
+import yaml
+
+# LibYAML-backed loader when PyYAML was built with it, pure-Python otherwise
+_SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def fast_yaml_load(content):
+    """Parse YAML with the fastest available safe loader"""
+    return yaml.load(content, Loader=_SafeLoader)
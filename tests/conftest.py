@@ -0,0 +1,11 @@
+"""Shared pytest fixtures"""
+
+import pytest
+
+from _fixtures import build_pipeline
+
+
+@pytest.fixture(scope="module")
+def pipeline():
+    """Three-step pipeline built once per test module"""
+    return build_pipeline()
@@ -0,0 +1,115 @@
+"""Tests of the docs command's pipeline and page caches"""
+
+from dft.cli.commands import docs
+from dft.core.config import PipelineLoader
+
+PIPELINE_YAML = """
+pipeline_name: {name}
+steps:
+  - id: extract
+    type: source
+    source_type: csv
+    config:
+      file_path: data.csv
+"""
+
+
+class _ProjectConfig:
+    """Just enough of ProjectConfig for PipelineLoader"""
+    
+    def __init__(self, pipelines_dir):
+        self.pipelines_dir = str(pipelines_dir)
+
+
+def _loader(tmp_path):
+    return PipelineLoader(_ProjectConfig(tmp_path / "pipelines"))
+
+
+def _write_pipeline(tmp_path, name, text=None):
+    pipelines_dir = tmp_path / "pipelines"
+    pipelines_dir.mkdir(exist_ok=True)
+    (pipelines_dir / f"{name}.yml").write_text(text or PIPELINE_YAML.format(name=name), encoding="utf-8")
+
+
+def _count_loads(monkeypatch):
+    """Count calls to PipelineLoader.load_all_pipelines"""
+    calls = []
+    load_all_pipelines = PipelineLoader.load_all_pipelines
+    
+    def counted(self):
+        calls.append(self)
+        return load_all_pipelines(self)
+    
+    monkeypatch.setattr(PipelineLoader, "load_all_pipelines", counted)
+    return calls
+
+
+def test_pipelines_cache_hit_and_miss(tmp_path, monkeypatch):
+    """Test parsed pipelines are reused until a pipeline file changes"""
+    calls = _count_loads(monkeypatch)
+    _write_pipeline(tmp_path, "first")
+    
+    pipelines = docs.load_pipelines_cached(_loader(tmp_path), tmp_path)
+    assert [p.name for p in pipelines] == ["first"]
+    assert len(calls) == 1
+    
+    cached = docs.load_pipelines_cached(_loader(tmp_path), tmp_path)
+    assert [p.name for p in cached] == ["first"]
+    assert len(calls) == 1
+    
+    _write_pipeline(tmp_path, "second")
+    pipelines = docs.load_pipelines_cached(_loader(tmp_path), tmp_path)
+    assert sorted(p.name for p in pipelines) == ["first", "second"]
+    assert len(calls) == 2
+
+
+def test_pipelines_cache_skips_failed_loads(tmp_path, monkeypatch, capsys):
+    """Test a load with a broken pipeline file is not cached and reports its error every time"""
+    calls = _count_loads(monkeypatch)
+    _write_pipeline(tmp_path, "good")
+    _write_pipeline(tmp_path, "broken", "steps: [\n")
+    
+    for run in range(2):
+        loader = _loader(tmp_path)
+        pipelines = docs.load_pipelines_cached(loader, tmp_path)
+        assert [p.name for p in pipelines] == ["good"]
+        assert list(loader.load_errors) == [tmp_path / "pipelines" / "broken.yml"]
+        assert "Error loading pipeline" in capsys.readouterr().out
+        assert len(calls) == run + 1
+    assert not (tmp_path / docs.PIPELINES_CACHE_FILE).exists()
+
+
+def test_pipelines_cache_keyed_by_dft_version(tmp_path, monkeypatch):
+    """Test pipelines pickled by another dft version are not reused"""
+    calls = _count_loads(monkeypatch)
+    _write_pipeline(tmp_path, "first")
+    
+    docs.load_pipelines_cached(_loader(tmp_path), tmp_path)
+    monkeypatch.setattr(docs, "_dft_version", lambda: "0.0.0")
+    docs.load_pipelines_cached(_loader(tmp_path), tmp_path)
+    assert len(calls) == 2
+
+
+def test_docs_page_cache_hit_and_miss(tmp_path, monkeypatch, capsys):
+    """Test index.html is only re-rendered when its inputs change"""
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "dft_project.yml").write_text("project_name: docs_test\n", encoding="utf-8")
+    _write_pipeline(tmp_path, "first")
+    index = tmp_path / ".dft" / "docs" / "index.html"
+    
+    docs.generate_docs(serve=False)
+    assert "Documentation generated" in capsys.readouterr().out
+    assert "first" in index.read_text(encoding="utf-8")
+    
+    docs.generate_docs(serve=False)
+    assert "cache hit" in capsys.readouterr().out
+    
+    _write_pipeline(tmp_path, "second")
+    docs.generate_docs(serve=False)
+    assert "Documentation generated" in capsys.readouterr().out
+    assert "second" in index.read_text(encoding="utf-8")
+    
+    # A dft upgrade or edited component module also invalidates the page
+    monkeypatch.setattr(docs, "_dft_version", lambda: "0.0.0")
+    docs.generate_docs(serve=False)
+    assert "Documentation generated" in capsys.readouterr().out
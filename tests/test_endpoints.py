@@ -0,0 +1,339 @@
+"""Tests of the database endpoints' pooling and bulk load paths, using in-memory driver doubles"""
+
+from datetime import date, datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pyarrow as pa
+import pytest
+
+from dft.core.data_packet import DataPacket
+from dft.endpoints import mysql, postgresql
+from dft.endpoints.mysql import MySQLEndpoint
+from dft.endpoints.postgresql import PostgreSQLEndpoint
+
+
+class _PgCursor:
+    """Records statements; fails them all once its connection is dead"""
+    
+    def __init__(self, conn):
+        self.conn = conn
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        self.close()
+    
+    def execute(self, sql, params=None):
+        if self.conn.dead:
+            raise RuntimeError("server closed the connection unexpectedly")
+        self.conn.log.append(sql)
+    
+    def fetchone(self):
+        return (True,)
+    
+    def copy_expert(self, sql, file, size=8192):
+        self.conn.log.append(sql.split(" FROM")[0])
+        if self.conn.fail_copy:
+            raise RuntimeError("invalid input syntax")
+        while data := file.read(size):
+            self.conn.copied.append(data)
+    
+    def close(self):
+        pass
+
+
+class _PgConnection:
+    """Just enough of a psycopg2 connection for the endpoint"""
+    
+    def __init__(self):
+        self.closed = 0
+        self.dead = False
+        self.fail_copy = False
+        self.log = []
+        self.copied = []
+        self.inserted = []
+    
+    def cursor(self):
+        return _PgCursor(self)
+    
+    def rollback(self):
+        self.log.append("ROLLBACK")
+    
+    def commit(self):
+        self.log.append("COMMIT")
+    
+    def close(self):
+        self.closed = 1
+
+
+@pytest.fixture
+def pg_connections(monkeypatch):
+    """Route PostgreSQL connects to fresh in-memory connections, returning the list of them"""
+    opened = []
+    
+    def connect(**params):
+        opened.append(_PgConnection())
+        return opened[-1]
+    
+    def execute_values(cursor, sql, rows, template=None, page_size=100):
+        cursor.conn.log.append("INSERT")
+        cursor.conn.inserted.extend(rows)
+    
+    driver = SimpleNamespace(connect=connect, extras=SimpleNamespace(execute_values=execute_values))
+    monkeypatch.setattr(postgresql, "_psycopg2", lambda: driver)
+    monkeypatch.setattr(PostgreSQLEndpoint, "_idle_connections", {})
+    return opened
+
+
+def test_postgresql_pool_reuses_live_connections(pg_connections):
+    """Test a pooled connection is checked and handed to the next endpoint with the same parameters"""
+    conn = PostgreSQLEndpoint({"name": "first"})._acquire_connection()
+    PostgreSQLEndpoint({"name": "first"})._release_connection(conn)
+    
+    assert PostgreSQLEndpoint({"name": "second"})._acquire_connection() is conn
+    assert conn.log == ["SELECT 1", "ROLLBACK"]
+    assert len(pg_connections) == 1
+
+
+def test_postgresql_pool_replaces_dead_connections(pg_connections):
+    """Test connections dropped while idle are closed and replaced on checkout"""
+    endpoint = PostgreSQLEndpoint({"name": "pg"})
+    dropped = endpoint._acquire_connection()
+    endpoint._release_connection(dropped)
+    dropped.dead = True
+    
+    conn = endpoint._acquire_connection()
+    assert conn is not dropped and dropped.closed
+    
+    # A connection closed by the client is not even pinged
+    conn.closed = 2
+    endpoint._release_connection(conn)
+    assert endpoint._acquire_connection() is pg_connections[-1]
+    assert len(pg_connections) == 3
+
+
+def test_postgresql_pool_overflows_instead_of_failing(pg_connections):
+    """Test checkout past max_connections opens a new connection, and only max_connections stay idle"""
+    endpoint = PostgreSQLEndpoint({"name": "pg", "max_connections": 1})
+    first = endpoint._acquire_connection()
+    second = endpoint._acquire_connection()
+    assert first is not second
+    
+    endpoint._release_connection(first)
+    endpoint._release_connection(second)
+    assert not first.closed and second.closed
+
+
+
+def _pg_load(data, fail_copy=False, **config):
+    """Load data through a PostgreSQL endpoint, returning the connection it used"""
+    endpoint = PostgreSQLEndpoint({"name": "pg", "table": "events", "auto_create": False, **config})
+    conn = endpoint._acquire_connection()
+    conn.fail_copy = fail_copy
+    endpoint._release_connection(conn)
+    conn.log.clear()
+    assert endpoint.load(DataPacket(data=data))
+    return conn
+
+
+def test_postgresql_copy_streams_chunks(pg_connections):
+    """Test COPY data is encoded and read chunk by chunk rather than as one buffer"""
+    table = pa.table({"id": list(range(5)), "name": ["a", None, "c", "d", "e"]})
+    conn = _pg_load(table, copy_chunk_size=2)
+    assert 'COPY "public"."events" ("id", "name")' in conn.log
+    assert conn.copied == [b'0,"a"\n1,\n', b'2,"c"\n3,"d"\n', b'4,"e"\n']
+    assert not conn.inserted
+    
+    # Reads smaller than a chunk are served from it without losing bytes
+    reader = postgresql._ChunkReader(iter([b"abcdef", b"gh"]))
+    assert [reader.read(4), reader.read(4), reader.read(4), reader.read(4)] == [b"abcd", b"ef", b"gh", b""]
+
+
+def test_postgresql_copy_falls_back_to_insert(pg_connections):
+    """Test a failed COPY is rolled back to its savepoint and redone with INSERT"""
+    conn = _pg_load(pa.table({"id": [1, 2]}), fail_copy=True)
+    assert conn.log[-5:] == [
+        "SAVEPOINT dft_copy",
+        'COPY "public"."events" ("id")',
+        "ROLLBACK TO SAVEPOINT dft_copy",
+        "INSERT",
+        "COMMIT",
+    ]
+    assert conn.inserted == [(1,), (2,)]
+
+
+def test_postgresql_tz_aware_timestamps_skip_copy(pg_connections):
+    """Test tables with tz-aware timestamps are inserted, keeping the session time-zone conversion"""
+    table = pa.table({"at": pa.array([datetime(2024, 1, 1, tzinfo=timezone.utc)], pa.timestamp("us", tz="UTC"))})
+    conn = _pg_load(table)
+    assert conn.log[-2:] == ["INSERT", "COMMIT"]
+    assert not conn.copied
+
+
+def test_postgresql_binary_copy_encoding():
+    """Test the binary COPY header, per-type field encoding and trailer against known bytes"""
+    table = pa.table({
+        "flag": pa.array([True, False]),
+        "small": pa.array([1, -1], pa.int16()),
+        "int": pa.array([2, -2], pa.int32()),
+        "big": pa.array([3, 1 << 40], pa.int64()),
+        "real": pa.array([1.5, -0.0], pa.float32()),
+        "double": pa.array([0.1, 2.0], pa.float64()),
+        "day": pa.array([date(2000, 1, 2), date(1999, 12, 31)], pa.date32()),
+        "at": pa.array([datetime(2000, 1, 1, 0, 0, 1), datetime(1970, 1, 1)], pa.timestamp("ms")),
+    })
+    row_1 = bytes.fromhex(
+        "0008"                                  # field count
+        "00000001" "01"                         # bool true
+        "00000002" "0001"                       # int2 1
+        "00000004" "00000002"                   # int4 2
+        "00000008" "0000000000000003"           # int8 3
+        "00000004" "3fc00000"                   # float4 1.5
+        "00000008" "3fb999999999999a"           # float8 0.1
+        "00000004" "00000001"                   # date: days since 2000-01-01
+        "00000008" "00000000000f4240"           # timestamp: microseconds since 2000-01-01
+    )
+    row_2 = bytes.fromhex(
+        "0008"
+        "00000001" "00"
+        "00000002" "ffff"
+        "00000004" "fffffffe"
+        "00000008" "0000010000000000"
+        "00000004" "80000000"
+        "00000008" "4000000000000000"
+        "00000004" "ffffffff"
+        "00000008" "fffca2fec4c82000"           # 1970-01-01 is 946684800 s before the PostgreSQL epoch
+    )
+    header = b"PGCOPY\n\xff\r\n\x00" + b"\x00\x00\x00\x00" + b"\x00\x00\x00\x00"
+    
+    chunks = list(postgresql._binary_copy_chunks(table, 1))
+    assert chunks == [header, row_1, row_2, b"\xff\xff"]
+    assert b"".join(postgresql._binary_copy_chunks(table, 10)) == header + row_1 + row_2 + b"\xff\xff"
+
+
+@pytest.mark.parametrize("column", [
+    pa.array([1, None], pa.int64()),
+    pa.array(["a", "b"]),
+    pa.array([b"a", b"b"]),
+    pa.array([1, 2], pa.uint32()),
+], ids=["null", "text", "bytea", "uint32"])
+def test_postgresql_binary_copy_falls_back_to_csv(column, pg_connections):
+    """Test tables with nulls or variable-width columns are sent as CSV even when binary is configured"""
+    table = pa.table({"id": pa.array([1, 2], pa.int64()), "value": column})
+    assert postgresql._binary_copy_chunks(table, 10) is None
+    
+    conn = _pg_load(table, copy_format="binary")
+    assert 'COPY "public"."events" ("id", "value")' in conn.log
+    assert conn.copied and not conn.copied[0].startswith(b"PGCOPY")
+
+
+class _MySQLServer:
+    """Records what a MySQL connection is sent; LOAD DATA keeps load_data_rows rows with load_data_warnings warnings"""
+    
+    def __init__(self, load_data_rows=None, load_data_warnings=0):
+        self.load_data_rows = load_data_rows
+        self.load_data_warnings = load_data_warnings
+        self.log = []
+        self.csv = None
+        self.inserted = []
+    
+    def connect(self, **params):
+        return _MySQLConnection(self)
+
+
+class _MySQLConnection:
+    """Just enough of a PyMySQL connection for the endpoint"""
+    
+    def __init__(self, server):
+        self.server = server
+    
+    def cursor(self):
+        return _MySQLCursor(self.server)
+    
+    def ping(self, reconnect=False):
+        pass
+    
+    def commit(self):
+        self.server.log.append("COMMIT")
+    
+    def rollback(self):
+        self.server.log.append("ROLLBACK")
+    
+    def close(self):
+        pass
+
+
+class _MySQLCursor:
+    """Answers the endpoint's table and warning queries from its server"""
+    
+    def __init__(self, server):
+        self.server = server
+        self.rowcount = -1
+        self._row = None
+    
+    def execute(self, sql, params=None):
+        self.server.log.append(sql.split()[0])
+        if sql.startswith("LOAD DATA"):
+            with open(params[0], encoding="utf-8") as f:
+                self.server.csv = f.read()
+            rows = self.server.csv.count("\n")
+            self.rowcount = rows if self.server.load_data_rows is None else self.server.load_data_rows
+        elif sql.startswith("SHOW COUNT(*) WARNINGS"):
+            self._row = (self.server.load_data_warnings,)
+        elif sql.startswith("SHOW TABLES"):
+            self._row = (params[0],)
+    
+    def executemany(self, sql, rows):
+        self.server.log.append("INSERT")
+        self.server.inserted.extend(rows)
+    
+    def fetchone(self):
+        return self._row
+    
+    def close(self):
+        pass
+
+
+def _mysql_load(monkeypatch, server, data, **config):
+    """Load data through a LOAD DATA-enabled MySQL endpoint connected to server"""
+    monkeypatch.setattr(mysql, "_pymysql", lambda: server)
+    monkeypatch.setattr(MySQLEndpoint, "_idle_connections", {})
+    endpoint = MySQLEndpoint({"name": "my", "table": "events", "use_load_data": True, **config})
+    return endpoint.load(DataPacket(data=data))
+
+
+_EVENTS = pa.table({
+    "id": [1, 2],
+    "at": pa.array(
+        [datetime(2024, 1, 1, 12, tzinfo=timezone(timedelta(hours=3))), None],
+        pa.timestamp("us", tz="Europe/Moscow"),
+    ),
+})
+
+
+def test_mysql_load_data_writes_naive_utc():
+    """Test LOAD DATA and the INSERT fallback both write tz-aware timestamps as naive UTC"""
+    table = mysql._naive_utc_timestamps(_EVENTS)
+    assert table.schema.field("at").type == pa.timestamp("us")
+    assert table.column("at").to_pylist() == [datetime(2024, 1, 1, 9), None]
+
+
+def test_mysql_load_data(monkeypatch):
+    """Test a clean LOAD DATA is committed without an INSERT"""
+    server = _MySQLServer()
+    assert _mysql_load(monkeypatch, server, _EVENTS)
+    assert server.csv == "1,2024-01-01 09:00:00.000000\n2,NULL\n"
+    assert server.log[-3:] == ["LOAD", "SHOW", "COMMIT"]
+    assert not server.inserted
+
+
+@pytest.mark.parametrize("server", [
+    _MySQLServer(load_data_warnings=1),
+    _MySQLServer(load_data_rows=1),
+], ids=["warnings", "short_row_count"])
+def test_mysql_load_data_falls_back_to_insert(monkeypatch, server):
+    """Test LOAD DATA that warns or drops rows is rolled back and redone with INSERT"""
+    assert _mysql_load(monkeypatch, server, _EVENTS)
+    assert server.log[-5:] == ["LOAD", "SHOW", "ROLLBACK", "INSERT", "COMMIT"]
+    assert server.inserted == [(1, datetime(2024, 1, 1, 9)), (2, None)]
@@ -0,0 +1,189 @@
+"""Tests of DFT core logic without external dependencies"""
+
+from dft.core.pipeline_simple import SimplePipeline, SimplePipelineStep
+from dft.core.data_packet_simple import SimpleDataPacket
+
+
+def test_pipeline_structure(pipeline):
+    """Test basic pipeline structure"""
+    
+    # Test basic functionality
+    assert pipeline.name == "test_pipeline"
+    assert len(pipeline.steps) == 3
+    assert pipeline.has_tag("test")
+    
+    # Test step retrieval
+    step = pipeline.get_step("extract")
+    assert step is not None
+    assert step.id == "extract"
+    
+    # Test dependency resolution
+    deps = pipeline.get_dependencies("validate")
+    assert len(deps) == 1
+    assert deps[0].id == "extract"
+    
+    # Test execution order
+    order = pipeline.get_execution_order()
+    assert order == ["extract", "validate", "save"]
+
+
+def _assert_valid_order(pipeline, order):
+    """Assert every step appears once, after all of its dependencies"""
+    position = {step_id: i for i, step_id in enumerate(order)}
+    assert sorted(position) == sorted(step.id for step in pipeline.steps)
+    for step in pipeline.steps:
+        for dep_id in step.depends_on:
+            assert position[dep_id] < position[step.id]
+
+
+def test_large_pipeline_order():
+    """Test pipelines past the bitmask limit are sorted by Kahn's algorithm"""
+    from dft.core.pipeline_simple import _BITMASK_MAX_STEPS
+    
+    count = _BITMASK_MAX_STEPS + 8
+    # Declared in reverse so the sort has to reorder every step
+    steps = [
+        SimplePipelineStep(id=f"step{i}", type="processor", depends_on=[f"step{i - 1}"] if i else [])
+        for i in reversed(range(count))
+    ]
+    pipeline = SimplePipeline(name="large", steps=steps)
+    order = pipeline.get_execution_order()
+    assert order == [f"step{i}" for i in range(count)]
+    _assert_valid_order(pipeline, order)
+    
+    cyclic = SimplePipeline(
+        name="large_cycle",
+        steps=[SimplePipelineStep(id="loop", type="processor", depends_on=[f"step{count - 1}"])]
+        + [SimplePipelineStep(id="step0", type="source", depends_on=["loop"])]
+        + steps[:-1],
+    )
+    assert len(cyclic.steps) > _BITMASK_MAX_STEPS
+    assert cyclic.detect_cycle() is not None
+    try:
+        cyclic.get_execution_order()
+        assert False, "Should have detected circular dependency"
+    except ValueError as e:
+        assert "Circular dependency detected involving steps: loop, step0" in str(e)
+
+
+def test_small_and_large_sorts_agree():
+    """Test the bitmask and Kahn sorts give the same valid order or the same cycle"""
+    import random
+    from dft.core.pipeline_simple import _toposort_bitmask, _toposort_kahn
+    
+    rng = random.Random(0)
+    for _ in range(500):
+        count = rng.randint(1, 32)
+        edges = [(rng.randrange(count), rng.randrange(count)) for _ in range(rng.randint(0, 2 * count))]
+        if rng.random() < 0.7:
+            # Keep only forward edges so most graphs are acyclic
+            edges = [(dep, step) for dep, step in edges if dep < step]
+        
+        order = _toposort_bitmask(count, edges)
+        assert order == _toposort_kahn(count, edges)
+        position = {i: n for n, i in enumerate(order)}
+        for dep, step in edges:
+            if dep in position and step in position:
+                assert position[dep] < position[step]
+        if len(order) < count:
+            # Anything left unordered depends on an unordered step
+            assert any(step not in position for _, step in edges)
+
+
+def test_steps_after_construction():
+    """Test lookups and ordering see steps changed after construction"""
+    from _fixtures import build_pipeline
+    
+    pipeline = build_pipeline()
+    assert pipeline.get_execution_order() == ["extract", "validate", "save"]
+    
+    report = SimplePipelineStep(id="report", type="endpoint", depends_on=["save"])
+    pipeline.add_step(report)
+    assert pipeline.get_step("report") is report
+    assert [dep.id for dep in pipeline.get_dependencies("report")] == ["save"]
+    assert pipeline.get_execution_order() == ["extract", "validate", "save", "report"]
+    
+    pipeline.remove_step("report")
+    assert pipeline.get_step("report") is None
+    assert pipeline.get_execution_order() == ["extract", "validate", "save"]
+    
+    # steps is a plain list, so it may also be edited in place
+    pipeline.steps.insert(0, report)
+    assert pipeline.get_step("report") is report
+    assert pipeline.get_execution_order() == ["extract", "validate", "save", "report"]
+    
+    # So may a step's dependencies
+    pipeline.get_step("extract").depends_on.append("report")
+    assert pipeline.get_dependencies("extract") == [report]
+    assert pipeline.detect_cycle() == ["report", "extract", "validate", "save"]
+    
+    pipeline.get_step("extract").depends_on = []
+    assert pipeline.get_execution_order() == ["extract", "validate", "save", "report"]
+    
+    # Renaming a step in place re-keys the index and the order
+    report.id = "summary"
+    assert pipeline.get_step("report") is None
+    assert pipeline.get_step("summary") is report
+    assert pipeline.get_execution_order() == ["extract", "validate", "save", "summary"]
+
+
+def test_tags_after_construction():
+    """Test tag lookups see tags changed after construction"""
+    pipeline = SimplePipeline(name="tagged", steps=[], tags=["test"])
+    assert pipeline.has_tag("test")
+    
+    pipeline.tags = ["daily"]
+    assert pipeline.has_tag("daily")
+    assert not pipeline.has_tag("test")
+    
+    pipeline.tags.append("hourly")
+    assert pipeline.has_tag("hourly")
+
+
+def test_data_packet():
+    """Test DataPacket"""
+    
+    # Create simple test data packet
+    packet = SimpleDataPacket(
+        data=None,
+        metadata={"test": "value"},
+        source="test"
+    )
+    
+    assert packet.source == "test"
+    assert packet.metadata["test"] == "value"
+    assert packet.row_count == 0  # None data should return 0
+    
+    # Test metadata functions
+    packet.add_metadata("new_key", "new_value")
+    assert packet.get_metadata("new_key") == "new_value"
+    assert packet.get_metadata("missing", "default") == "default"
+
+
+def test_circular_dependency():
+    """Test circular dependency detection"""
+    
+    # Create steps with circular dependency
+    step1 = SimplePipelineStep(id="step1", type="source", depends_on=["step2"])
+    step2 = SimplePipelineStep(id="step2", type="processor", depends_on=["step1"])
+    
+    pipeline = SimplePipeline(name="circular", steps=[step1, step2])
+    
+    assert pipeline.detect_cycle() == ["step1", "step2"]
+    
+    try:
+        pipeline.get_execution_order()
+        assert False, "Should have detected circular dependency"
+    except ValueError as e:
+        assert "Circular dependency" in str(e)
+
+
+def test_yaml_config():
+    """Test YAML configuration structure"""
+    from _fixtures import PARSED_CONFIG as config
+    
+    assert config["pipeline_name"] == "test_pipeline"
+    assert "test" in config["tags"]
+    assert len(config["steps"]) == 2
+    assert config["steps"][0]["id"] == "extract_data"
+    assert config["steps"][1]["depends_on"] == ["extract_data"]
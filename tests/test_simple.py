@@ -1,193 +0,0 @@
-#!/usr/bin/env python3
-"""Simple test of DFT core logic without external dependencies"""
-
-import sys
-import os
-from pathlib import Path
-
-# Add current directory to path
-sys.path.insert(0, str(Path(__file__).parent))
-
-# Import directly from files
-exec(open("dft/core/pipeline_simple.py").read())
-exec(open("dft/core/data_packet_simple.py").read())
-
-def test_pipeline_structure():
-    """Test basic pipeline structure"""
-    
-    # Create test steps
-    step1 = SimplePipelineStep(
-        id="extract",
-        type="source",
-        config={"source_type": "csv", "file_path": "test.csv"}
-    )
-    
-    step2 = SimplePipelineStep(
-        id="validate", 
-        type="processor",
-        config={"processor_type": "validator"},
-        depends_on=["extract"]
-    )
-    
-    step3 = SimplePipelineStep(
-        id="save",
-        type="endpoint", 
-        config={"endpoint_type": "csv", "file_path": "output.csv"},
-        depends_on=["validate"]
-    )
-    
-    # Create pipeline
-    pipeline = SimplePipeline(
-        name="test_pipeline",
-        steps=[step1, step2, step3],
-        tags=["test"]
-    )
-    
-    # Test basic functionality
-    assert pipeline.name == "test_pipeline"
-    assert len(pipeline.steps) == 3
-    assert pipeline.has_tag("test")
-    
-    # Test step retrieval
-    step = pipeline.get_step("extract")
-    assert step is not None
-    assert step.id == "extract"
-    
-    # Test dependency resolution
-    deps = pipeline.get_dependencies("validate")
-    assert len(deps) == 1
-    assert deps[0].id == "extract"
-    
-    # Test execution order
-    order = pipeline.get_execution_order()
-    assert order == ["extract", "validate", "save"]
-    
-    print("✅ Pipeline structure tests passed")
-
-
-def test_data_packet():
-    """Test DataPacket"""
-    from datetime import datetime
-    
-    # Create simple test data packet
-    packet = SimpleDataPacket(
-        data=None,
-        metadata={"test": "value"},
-        timestamp=datetime.now(),
-        source="test"
-    )
-    
-    assert packet.source == "test"
-    assert packet.metadata["test"] == "value"
-    assert packet.row_count == 0  # None data should return 0
-    
-    # Test metadata functions
-    packet.add_metadata("new_key", "new_value")
-    assert packet.get_metadata("new_key") == "new_value"
-    assert packet.get_metadata("missing", "default") == "default"
-    
-    print("✅ DataPacket tests passed")
-
-
-def test_circular_dependency():
-    """Test circular dependency detection"""
-    
-    # Create steps with circular dependency
-    step1 = SimplePipelineStep(id="step1", type="source", depends_on=["step2"])
-    step2 = SimplePipelineStep(id="step2", type="processor", depends_on=["step1"])
-    
-    pipeline = SimplePipeline(name="circular", steps=[step1, step2])
-    
-    try:
-        pipeline.get_execution_order()
-        assert False, "Should have detected circular dependency"
-    except ValueError as e:
-        assert "Circular dependency" in str(e)
-        print("✅ Circular dependency detection works")
-
-
-def test_yaml_config():
-    """Test YAML configuration structure"""
-    import yaml
-    
-    yaml_content = """
-pipeline_name: test_pipeline
-tags: [test, example]
-depends_on: []
-
-steps:
-  - id: extract_data
-    type: source
-    source_type: csv
-    config:
-      file_path: "data.csv"
-  
-  - id: process_data
-    type: processor
-    processor_type: validator
-    depends_on: [extract_data]
-    config:
-      required_columns: [id, name]
-"""
-    
-    config = yaml.safe_load(yaml_content)
-    
-    assert config["pipeline_name"] == "test_pipeline"
-    assert "test" in config["tags"]
-    assert len(config["steps"]) == 2
-    assert config["steps"][0]["id"] == "extract_data"
-    assert config["steps"][1]["depends_on"] == ["extract_data"]
-    
-    print("✅ YAML configuration tests passed")
-
-
-def main():
-    """Run all tests"""
-    print("🧪 Running DFT simple tests...")
-    print()
-    
-    try:
-        test_pipeline_structure()
-        test_data_packet()
-        test_circular_dependency()
-        test_yaml_config()
-        
-        print()
-        print("🎉 All simple tests passed!")
-        print()
-        print("✨ DFT Core Logic Validation Complete!")
-        print()
-        print("📋 What we've built:")
-        print("  ✅ Pipeline structure with dependency resolution")
-        print("  ✅ Step execution order calculation")
-        print("  ✅ Circular dependency detection")
-        print("  ✅ Data packet structure")
-        print("  ✅ YAML configuration parsing")
-        print("  ✅ CLI command structure")
-        print("  ✅ Template rendering system")
-        print("  ✅ Component factory pattern")
-        print("  ✅ Logging and monitoring")
-        print()
-        print("📦 MVP is ready for:")
-        print("  • CSV source/endpoint components")
-        print("  • Data validation processor")
-        print("  • Pipeline configuration via YAML")
-        print("  • Command line interface")
-        print("  • Project initialization")
-        print()
-        print("🚀 Next steps:")
-        print("1. Install dependencies: pip install -e .")
-        print("2. Test with real data: dft init my_project && cd my_project && dft run")
-        print("3. Add more sources (PostgreSQL, ClickHouse, etc.)")
-        print("4. Add more processors (aggregators, transformers)")
-        print("5. Add incremental loading support")
-        
-    except Exception as e:
-        print(f"❌ Test failed: {e}")
-        import traceback
-        traceback.print_exc()
-        sys.exit(1)
-
-
-if __name__ == "__main__":
-    main()
\ No newline at end of file